@@ -1,19 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 import logging
 import json
 from datetime import datetime
 
-from backend.services.gptService import GPTService
+from backend.services.gptService import gpt_service
 from utils.textCleaner import TextCleaner
 from utils.timeUtils import TimeUtils
 
 logger = logging.getLogger(__name__)
 
 # Initialize services
-gpt_service = GPTService()
 text_cleaner = TextCleaner()
 time_utils = TimeUtils()
 
@@ -53,41 +52,47 @@ class ChatHistory(BaseModel):
     messages: List[Dict[str, str]] = Field(..., description="Chat messages")
     total_messages: int = Field(..., description="Total message count")
 
+def _begin_chat_turn(chat_message: ChatMessage, request: Request) -> tuple:
+    """Validate the message and record it in its session; returns (session_id, cleaned_message)"""
+    # Validate and clean input
+    if not chat_message.message or not chat_message.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    
+    cleaned_message = text_cleaner.clean_text(chat_message.message)
+    if not cleaned_message:
+        raise HTTPException(status_code=400, detail="Message contains invalid content")
+    
+    # Get or create session
+    session_id = chat_message.session_id or _generate_session_id()
+    if session_id not in chat_sessions:
+        chat_sessions[session_id] = {
+            "user_id": _extract_user_id(request),
+            "created_at": time_utils.get_current_timestamp(),
+            "last_activity": time_utils.get_current_timestamp(),
+            "message_count": 0,
+            "status": "active",
+            "messages": []
+        }
+    
+    # Update session activity
+    chat_sessions[session_id]["last_activity"] = time_utils.get_current_timestamp()
+    chat_sessions[session_id]["message_count"] += 1
+    
+    # Add user message to history
+    user_message = {
+        "role": "user",
+        "content": cleaned_message,
+        "timestamp": time_utils.get_current_timestamp()
+    }
+    chat_sessions[session_id]["messages"].append(user_message)
+    
+    return session_id, cleaned_message
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_bot(chat_message: ChatMessage, request: Request):
     """Chat with the SafeChild AI bot"""
     try:
-        # Validate and clean input
-        if not chat_message.message or not chat_message.message.strip():
-            raise HTTPException(status_code=400, detail="Message cannot be empty")
-        
-        cleaned_message = text_cleaner.clean_text(chat_message.message)
-        if not cleaned_message:
-            raise HTTPException(status_code=400, detail="Message contains invalid content")
-        
-        # Get or create session
-        session_id = chat_message.session_id or _generate_session_id()
-        if session_id not in chat_sessions:
-            chat_sessions[session_id] = {
-                "user_id": _extract_user_id(request),
-                "created_at": time_utils.get_current_timestamp(),
-                "last_activity": time_utils.get_current_timestamp(),
-                "message_count": 0,
-                "status": "active",
-                "messages": []
-            }
-        
-        # Update session activity
-        chat_sessions[session_id]["last_activity"] = time_utils.get_current_timestamp()
-        chat_sessions[session_id]["message_count"] += 1
-        
-        # Add user message to history
-        user_message = {
-            "role": "user",
-            "content": cleaned_message,
-            "timestamp": time_utils.get_current_timestamp()
-        }
-        chat_sessions[session_id]["messages"].append(user_message)
+        session_id, cleaned_message = _begin_chat_turn(chat_message, request)
         
         # Get AI response
         user_context = chat_message.user_context or {}
@@ -121,6 +126,7 @@ async def chat_with_bot(chat_message: ChatMessage, request: Request):
             "model_info": {
                 "model": ai_response.get("model"),
                 "tokens_used": ai_response.get("tokens_used"),
+                "cached": ai_response.get("cached", False),
                 "fallback": ai_response.get("fallback", False)
             } if ai_response.get("success") else None,
             "fallback": ai_response.get("fallback", False)
@@ -135,6 +141,30 @@ async def chat_with_bot(chat_message: ChatMessage, request: Request):
         logger.error(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/chat/stream")
+async def stream_chat_with_bot(chat_message: ChatMessage, request: Request):
+    """Chat with the SafeChild AI bot, streaming the reply as server-sent events"""
+    session_id, cleaned_message = _begin_chat_turn(chat_message, request)
+    message_id = _generate_message_id()
+    
+    async def event_stream():
+        async for event in gpt_service.stream_chatbot_response(
+            cleaned_message,
+            chat_sessions[session_id]["messages"],
+            chat_message.user_context or {}
+        ):
+            if event.get("done"):
+                # Add AI response to history once the full reply is known
+                chat_sessions[session_id]["messages"].append({
+                    "role": "assistant",
+                    "content": event.get("response", "I'm sorry, I couldn't process your request."),
+                    "timestamp": time_utils.get_current_timestamp()
+                })
+                event = {**event, "session_id": session_id, "message_id": message_id}
+            yield f"data: {json.dumps(event)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.post("", response_model=ChatResponse)
 async def chat_with_bot_root(chat_message: ChatMessage, request: Request):
     return await chat_with_bot(chat_message, request)
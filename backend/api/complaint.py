@@ -10,7 +10,7 @@ import os
 import io
 
 # Import services
-from backend.services.gptService import GPTService
+from backend.services.gptService import gpt_service
 from backend.services.pdfService import PDFService
 from utils.textCleaner import TextCleaner
 from utils.timeUtils import TimeUtils
@@ -58,7 +58,7 @@ class ComplaintResponse(BaseModel):
 
 class ComplaintAPI:
     def __init__(self):
-        self.gpt_service = GPTService()
+        self.gpt_service = gpt_service
         self.pdf_service = PDFService()
         self.text_cleaner = TextCleaner()
         self.time_utils = TimeUtils()
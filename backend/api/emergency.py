@@ -18,6 +18,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/emergency", tags=["emergency"])
 
+# Emergency SMS body, joined once at import so each alert only pays for format_map
+_EMERGENCY_MESSAGE_TEMPLATE = "\n".join((
+    "🚨 EMERGENCY ALERT 🚨",
+    "",
+    "{name}, there is an emergency situation that requires immediate attention.",
+    "",
+    "📍 Location: {location}",
+    "🚨 Level: {level}",
+    "📝 Description: {description}",
+    "⏰ Time: {timestamp}",
+    "",
+    "{level_description}",
+    "",
+    "Please respond immediately and take appropriate action.",
+    "",
+    "SafeChild-Lite Emergency System"
+))
+
 class EmergencyContact(BaseModel):
     name: str
     phone: str
@@ -225,24 +243,14 @@ class EmergencyAPI:
         """Create emergency SMS message"""
         level_info = self.emergency_levels.get(alert.emergency_level, {})
         
-        message = f"""
-🚨 EMERGENCY ALERT 🚨
-
-{contact.name}, there is an emergency situation that requires immediate attention.
-
-📍 Location: {alert.location}
-🚨 Level: {alert.emergency_level.upper()}
-📝 Description: {alert.description}
-⏰ Time: {alert.timestamp}
-
-{level_info.get('description', 'Safety concern detected')}
-
-Please respond immediately and take appropriate action.
-
-SafeChild-Lite Emergency System
-        """.strip()
-        
-        return message
+        return _EMERGENCY_MESSAGE_TEMPLATE.format_map({
+            "name": contact.name,
+            "location": alert.location,
+            "level": alert.emergency_level.upper(),
+            "description": alert.description,
+            "timestamp": alert.timestamp,
+            "level_description": level_info.get('description', 'Safety concern detected')
+        })
     
     async def process_emergency(self, request: EmergencyRequest) -> EmergencyResponse:
         """Process emergency alert and send notifications"""
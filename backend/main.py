@@ -1,74 +1,165 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import MutableHeaders
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
 import logging
+import itertools
+import logging.handlers
 import os
+import queue
 import time
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+# Use uvloop's faster event loop when available (Linux/macOS)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Load environment variables
 load_dotenv()
 
 # Import API routers
 from .api.chatbot import router as chatbot_router
 from .api.complaint import router as complaint_router
-from .api.emergency import router as emergency_router
+from .api.emergency import router as emergency_router, emergency_api
 from .api.awareness import router as awareness_router
 from .api.tts import router as tts_router
-from .api.config import router as config_router
+from .api.config import router as config_router, ai_manager
+from .services.gptService import gpt_service
 from .config import settings
 
 # Import utilities
 from ..utils.timeUtils import TimeUtils
 from ..utils.textCleaner import TextCleaner
 
-# Configure logging
+# Configure logging: request handlers only enqueue records, a background
+# listener thread does the formatting and stream I/O
+log_queue = queue.Queue(-1)
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+log_listener = logging.handlers.QueueListener(
+    log_queue, log_stream_handler, respect_handler_level=True
+)
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=settings.log_level.upper(),
+    handlers=[logging.handlers.QueueHandler(log_queue)],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+# Shared utilities (stateless, reused by every request)
+time_utils = TimeUtils()
+text_cleaner = TextCleaner()
+
+# Static response bodies; endpoints only add a fresh timestamp
+ROOT_INFO = {
+    "message": "Welcome to SafeChild-Lite Backend API",
+    "version": "1.0.0",
+    "description": "Child safety application backend",
+    "status": "active"
+}
+
+SERVICES_STATUS = {
+    "chatbot": {
+        "endpoint": "/api/chatbot/health",
+        "status": "active"
+    },
+    "complaint": {
+        "endpoint": "/api/complaint/health",
+        "status": "active"
+    },
+    "emergency": {
+        "endpoint": "/api/emergency/health",
+        "status": "active"
+    },
+    "awareness": {
+        "endpoint": "/api/awareness/health",
+        "status": "active"
+    }
+}
+
+API_STATUS = {
+    "status": "active",
+    "services": SERVICES_STATUS,
+    "total_services": len(SERVICES_STATUS)
+}
+
+# Routes advertised in 404 responses
+AVAILABLE_ROUTES = (
+    "/",
+    "/health",
+    "/docs",
+    "/redoc",
+    "/api/status",
+    "/api/environment",
+    "/api/metrics",
+    "/api/chatbot/*",
+    "/api/complaint/*",
+    "/api/emergency/*",
+    "/api/awareness/*"
+)
+
+# Required environment variables, checked once since they are fixed for the process lifetime
+REQUIRED_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "TWILIO_ACCOUNT_SID",
+    "TWILIO_AUTH_TOKEN",
+    "TWILIO_PHONE_NUMBER"
+)
+REQUIRED_ENV_VARS_SET = frozenset(REQUIRED_ENV_VARS)
+# One key-view intersection instead of a getenv call per variable; empty values count as missing
+PRESENT_ENV_VARS = frozenset(var for var in os.environ.keys() & REQUIRED_ENV_VARS_SET if os.environ[var])
+MISSING_ENV_VARS = tuple(var for var in REQUIRED_ENV_VARS if var not in PRESENT_ENV_VARS)
+
+# Environment info (non-sensitive)
+ENVIRONMENT_INFO = {
+    "environment": {
+        "NODE_ENV": os.getenv("NODE_ENV", "development"),
+        "PYTHON_VERSION": os.getenv("PYTHON_VERSION", "3.9+"),
+        "PLATFORM": os.getenv("PLATFORM", "unknown"),
+        "DEPLOYMENT": os.getenv("DEPLOYMENT", "local")
+    },
+    # Check if required services are configured
+    "services_configured": {
+        "openai": "OPENAI_API_KEY" in PRESENT_ENV_VARS,
+        "twilio": {"TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"} <= PRESENT_ENV_VARS,
+        "tts": True,  # gTTS is local
+        "pdf": True   # ReportLab is local
+    }
+}
+
 # Global variables
-startup_time = None
-request_count = 0
+startup_time = None  # time.monotonic() at startup, for uptime
+startup_datetime = None  # wall-clock startup time, for display
+request_ids = itertools.count(1)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global startup_time
+    global startup_time, startup_datetime
     
     # Startup
-    startup_time = time.time()
+    log_listener.start()
+    startup_time = time.monotonic()
+    startup_datetime = time_utils.get_current_datetime()
     logger.info("🚀 SafeChild-Lite Backend starting up...")
     
-    # Initialize utilities
-    try:
-        time_utils = TimeUtils()
-        text_cleaner = TextCleaner()
-        logger.info("✅ Utilities initialized successfully")
-    except Exception as e:
-        logger.error(f"❌ Error initializing utilities: {str(e)}")
-    
-    # Check environment variables
-    required_env_vars = [
-        "OPENAI_API_KEY",
-        "TWILIO_ACCOUNT_SID",
-        "TWILIO_AUTH_TOKEN",
-        "TWILIO_PHONE_NUMBER"
-    ]
-    
-    missing_vars = []
-    for var in required_env_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    # Utilities are created once at import and shared by all requests
+    logger.info("✅ Utilities initialized successfully")
     
-    if missing_vars:
-        logger.warning(f"⚠️ Missing environment variables: {', '.join(missing_vars)}")
+    # Report environment variables checked at import
+    if MISSING_ENV_VARS:
+        logger.warning(f"⚠️ Missing environment variables: {', '.join(MISSING_ENV_VARS)}")
         logger.warning("Some features may not work properly")
     else:
         logger.info("✅ All required environment variables are set")
@@ -79,9 +170,13 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 SafeChild-Lite Backend shutting down...")
+    await emergency_api.sms_service.aclose()
+    await ai_manager.close()
+    await gpt_service.aclose()
     if startup_time:
-        uptime = time.time() - startup_time
+        uptime = time.monotonic() - startup_time
         logger.info(f"⏱️ Total uptime: {uptime:.2f} seconds")
+    log_listener.stop()
 
 # Create FastAPI app
 app = FastAPI(
@@ -90,6 +185,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -98,42 +194,59 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
+    expose_headers=["X-Process-Time", "X-Request-ID"],
 )
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    global request_count
-    request_count += 1
-    
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"📥 Request {request_count}: {request.method} {request.url}")
-    
-    # Process request
-    response = await call_next(request)
-    
-    # Calculate processing time
-    process_time = time.time() - start_time
-    
-    # Log response
-    logger.info(f"📤 Response {request_count}: {response.status_code} ({process_time:.3f}s)")
+# Request logging middleware (pure ASGI, so response bodies are never buffered)
+class LogRequestsMiddleware:
+    """Log each HTTP request and add timing/request-id headers to its response"""
     
-    # Add processing time to response headers
-    response.headers["X-Process-Time"] = str(process_time)
-    response.headers["X-Request-ID"] = str(request_count)
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = next(request_ids)
+        # Expose the id to endpoints via request.state
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        start_time = time.perf_counter()
+        
+        # Log request (building the URL walks the scope, so skip it when INFO is off)
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            logger.info("📥 Request %d: %s %s", request_id, scope["method"], Request(scope).url)
+        
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time = time.perf_counter() - start_time
+                
+                # Log response
+                if log_enabled:
+                    logger.info("📤 Response %d: %d (%.3fs)", request_id, message["status"], process_time)
+                
+                # Add processing time to response headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(process_time)
+                headers["X-Request-ID"] = str(request_id)
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
+
+app.add_middleware(LogRequestsMiddleware)
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
     logger.warning(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "Validation Error",
@@ -146,7 +259,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
     logger.warning(f"HTTP error {exc.status_code}: {exc.detail}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTP Error",
@@ -159,8 +272,12 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    # Tracebacks are costly to render, so only capture them in debug mode
+    if settings.debug:
+        logger.error(f"Unexpected error: {str(exc)}", exc_info=exc)
+    else:
+        logger.error(f"Unexpected error: {type(exc).__name__}: {str(exc)}")
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -181,34 +298,27 @@ app.include_router(tts_router)
 @app.get("/")
 async def root():
     """Root endpoint with application information"""
-    return {
-        "message": "Welcome to SafeChild-Lite Backend API",
-        "version": "1.0.0",
-        "description": "Child safety application backend",
-        "status": "active",
-        "timestamp": TimeUtils().get_current_timestamp()
-    }
+    return ORJSONResponse({**ROOT_INFO, "timestamp": time_utils.get_current_timestamp()})
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
-    global startup_time, request_count
+    global startup_time, startup_datetime
     
     try:
-        # Check utilities
-        time_utils = TimeUtils()
-        text_cleaner = TextCleaner()
+        # Request ids are sequential, so the current one is the running total
+        request_count = getattr(request.state, "request_id", 0)
         
         # Calculate uptime
-        uptime = time.time() - startup_time if startup_time else 0
+        uptime = time.monotonic() - startup_time if startup_time else 0
         
         return {
             "status": "healthy",
             "service": "safechild-lite-backend",
             "version": "1.0.0",
             "uptime_seconds": round(uptime, 2),
-            "uptime_formatted": TimeUtils().get_relative_time(startup_time) if startup_time else "unknown",
+            "uptime_formatted": time_utils.get_relative_time(startup_datetime) if startup_datetime else "unknown",
             "total_requests": request_count,
             "timestamp": time_utils.get_current_timestamp(),
             "utilities": {
@@ -219,13 +329,13 @@ async def health_check():
         
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "service": "safechild-lite-backend",
                 "error": str(e),
-                "timestamp": TimeUtils().get_current_timestamp()
+                "timestamp": time_utils.get_current_timestamp()
             }
         )
 
@@ -234,43 +344,16 @@ async def health_check():
 async def api_status():
     """Get status of all API endpoints"""
     try:
-        time_utils = TimeUtils()
-        
-        # Check each service
-        services = {
-            "chatbot": {
-                "endpoint": "/api/chatbot/health",
-                "status": "active"
-            },
-            "complaint": {
-                "endpoint": "/api/complaint/health",
-                "status": "active"
-            },
-            "emergency": {
-                "endpoint": "/api/emergency/health",
-                "status": "active"
-            },
-            "awareness": {
-                "endpoint": "/api/awareness/health",
-                "status": "active"
-            }
-        }
-        
-        return {
-            "status": "active",
-            "services": services,
-            "total_services": len(services),
-            "timestamp": time_utils.get_current_timestamp()
-        }
+        return ORJSONResponse({**API_STATUS, "timestamp": time_utils.get_current_timestamp()})
         
     except Exception as e:
         logger.error(f"API status check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
                 "error": str(e),
-                "timestamp": TimeUtils().get_current_timestamp()
+                "timestamp": time_utils.get_current_timestamp()
             }
         )
 
@@ -279,59 +362,40 @@ async def api_status():
 async def environment_info():
     """Get environment information (non-sensitive)"""
     try:
-        time_utils = TimeUtils()
-        
-        # Get environment variables (non-sensitive)
-        env_info = {
-            "NODE_ENV": os.getenv("NODE_ENV", "development"),
-            "PYTHON_VERSION": os.getenv("PYTHON_VERSION", "3.9+"),
-            "PLATFORM": os.getenv("PLATFORM", "unknown"),
-            "DEPLOYMENT": os.getenv("DEPLOYMENT", "local")
-        }
-        
-        # Check if required services are configured
-        services_configured = {
-            "openai": bool(os.getenv("OPENAI_API_KEY")),
-            "twilio": bool(os.getenv("TWILIO_ACCOUNT_SID") and os.getenv("TWILIO_AUTH_TOKEN")),
-            "tts": True,  # gTTS is local
-            "pdf": True   # ReportLab is local
-        }
-        
         return {
-            "environment": env_info,
-            "services_configured": services_configured,
+            **ENVIRONMENT_INFO,
             "timestamp": time_utils.get_current_timestamp()
         }
         
     except Exception as e:
         logger.error(f"Environment info check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": str(e),
-                "timestamp": TimeUtils().get_current_timestamp()
+                "timestamp": time_utils.get_current_timestamp()
             }
         )
 
 # Metrics endpoint
 @app.get("/api/metrics")
-async def get_metrics():
+async def get_metrics(request: Request):
     """Get application metrics"""
-    global startup_time, request_count
+    global startup_time, startup_datetime
     
     try:
-        time_utils = TimeUtils()
+        request_count = getattr(request.state, "request_id", 0)
         
         # Calculate metrics
-        uptime = time.time() - startup_time if startup_time else 0
+        uptime = time.monotonic() - startup_time if startup_time else 0
         requests_per_minute = (request_count / (uptime / 60)) if uptime > 0 else 0
         
         metrics = {
             "uptime_seconds": round(uptime, 2),
-            "uptime_formatted": time_utils.get_relative_time(startup_time) if startup_time else "unknown",
+            "uptime_formatted": time_utils.get_relative_time(startup_datetime) if startup_datetime else "unknown",
             "total_requests": request_count,
             "requests_per_minute": round(requests_per_minute, 2),
-            "startup_time": time_utils.format_timestamp(startup_time) if startup_time else None,
+            "startup_time": time_utils.format_timestamp(startup_datetime) if startup_datetime else None,
             "current_time": time_utils.get_current_timestamp()
         }
         
@@ -339,48 +403,31 @@ async def get_metrics():
         
     except Exception as e:
         logger.error(f"Metrics collection failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": str(e),
-                "timestamp": TimeUtils().get_current_timestamp()
+                "timestamp": time_utils.get_current_timestamp()
             }
         )
 
-# API documentation customization
-@app.get("/docs", include_in_schema=False)
-async def custom_docs():
-    """Custom API documentation"""
-    return {
-        "message": "API Documentation",
-        "docs_url": "/docs",
-        "redoc_url": "/redoc",
-        "openapi_url": "/openapi.json"
-    }
-
-# Error handling for 404
-@app.get("/{full_path:path}")
-async def catch_all(full_path: str):
-    """Catch all unmatched routes"""
+# Error handling for 404 (unmatched routes are rejected by the router itself)
+@app.exception_handler(404)
+async def not_found_handler(request: Request, exc: Exception):
+    """Handle unmatched routes"""
+    # The router only sets "endpoint" on a match, so any 404 raised after
+    # matching a route keeps the regular HTTP error shape
+    if "endpoint" in request.scope and isinstance(exc, StarletteHTTPException):
+        return await http_exception_handler(request, exc)
+    
+    full_path = request.url.path.lstrip("/")
     logger.warning(f"404 - Route not found: {full_path}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
             "message": f"Route '{full_path}' not found",
-            "available_routes": [
-                "/",
-                "/health",
-                "/docs",
-                "/redoc",
-                "/api/status",
-                "/api/environment",
-                "/api/metrics",
-                "/api/chatbot/*",
-                "/api/complaint/*",
-                "/api/emergency/*",
-                "/api/awareness/*"
-            ]
+            "available_routes": AVAILABLE_ROUTES
         }
     )
 
@@ -395,5 +442,9 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False,  # LogRequestsMiddleware already logs every request
         log_level="info"
     )
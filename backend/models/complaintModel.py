@@ -1,7 +1,15 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from typing import Optional, List, Dict, Any, Literal
+from datetime import datetime, date, time
 from enum import Enum
+import re
+
+# Precompiled validation patterns
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+
+# Shared model configuration
+_COMPLAINT_CONFIG = ConfigDict(use_enum_values=True)
 
 class IncidentType(str, Enum):
     """Enumeration of incident types"""
@@ -51,26 +59,34 @@ class LegalActionType(str, Enum):
     INVESTIGATION = "investigation"
     DISCIPLINARY_ACTION = "disciplinary_action"
 
+# Literal value sets for request validation: pydantic-core matches literals with a
+# hash lookup instead of coercing through the Enum class. The enums above stay the
+# source of truth for business logic.
+IncidentTypeValue = Literal[tuple(member.value for member in IncidentType)]
+ComplaintStatusValue = Literal[tuple(member.value for member in ComplaintStatus)]
+PriorityLevelValue = Literal[tuple(member.value for member in PriorityLevel)]
+ChildGenderValue = Literal[tuple(member.value for member in ChildGender)]
+
 class ComplaintData(BaseModel):
     """Data model for complaint information"""
     
     # Basic complaint information
     complaint_id: Optional[str] = Field(None, description="Unique complaint identifier")
-    status: ComplaintStatus = Field(default=ComplaintStatus.DRAFT, description="Current status of the complaint")
-    priority: PriorityLevel = Field(default=PriorityLevel.MEDIUM, description="Priority level of the complaint")
+    status: ComplaintStatusValue = Field(default=ComplaintStatus.DRAFT.value, description="Current status of the complaint")
+    priority: PriorityLevelValue = Field(default=PriorityLevel.MEDIUM.value, description="Priority level of the complaint")
     created_at: Optional[datetime] = Field(None, description="When the complaint was created")
     updated_at: Optional[datetime] = Field(None, description="When the complaint was last updated")
     
     # Child information
     child_name: str = Field(..., min_length=1, max_length=100, description="Name of the child involved")
     child_age: int = Field(..., ge=0, le=18, description="Age of the child")
-    child_gender: Optional[ChildGender] = Field(None, description="Gender of the child")
+    child_gender: Optional[ChildGenderValue] = Field(None, description="Gender of the child")
     child_school: Optional[str] = Field(None, max_length=200, description="School or institution the child attends")
     child_grade: Optional[str] = Field(None, max_length=20, description="Grade level of the child")
     child_contact: Optional[str] = Field(None, max_length=50, description="Contact information for the child")
     
     # Incident information
-    incident_type: IncidentType = Field(..., description="Type of incident that occurred")
+    incident_type: IncidentTypeValue = Field(..., description="Type of incident that occurred")
     incident_date: str = Field(..., description="Date when the incident occurred")
     incident_time: str = Field(..., description="Time when the incident occurred")
     location: str = Field(..., min_length=1, max_length=500, description="Location where the incident occurred")
@@ -105,85 +121,96 @@ class ComplaintData(BaseModel):
     assigned_to: Optional[str] = Field(None, max_length=100, description="Person assigned to handle the complaint")
     
     # Validation methods
-    @validator('incident_date')
+    @field_validator('incident_date')
+    @classmethod
     def validate_incident_date(cls, v):
         """Validate incident date format"""
         try:
-            datetime.strptime(v, '%Y-%m-%d')
+            # Same inputs as strptime('%Y-%m-%d'); fromisoformat alone would also take week dates
+            year, month, day = v.split('-')
+            if not (len(year) == 4 and 1 <= len(month) <= 2 and 1 <= len(day) <= 2
+                    and (year + month + day).isascii() and (year + month + day).isdigit()):
+                raise ValueError
+            date(int(year), int(month), int(day))
             return v
         except ValueError:
             raise ValueError('incident_date must be in YYYY-MM-DD format')
     
-    @validator('incident_time')
+    @field_validator('incident_time')
+    @classmethod
     def validate_incident_time(cls, v):
         """Validate incident time format"""
         try:
-            datetime.strptime(v, '%H:%M')
+            # Same inputs as strptime('%H:%M'), which also takes single-digit fields like "1:05"
+            hour, minute = v.split(':')
+            if not (1 <= len(hour) <= 2 and 1 <= len(minute) <= 2
+                    and (hour + minute).isascii() and (hour + minute).isdigit()):
+                raise ValueError
+            time(int(hour), int(minute))
             return v
         except ValueError:
             raise ValueError('incident_time must be in HH:MM format')
     
-    @validator('guardian_phone')
+    @field_validator('guardian_phone')
+    @classmethod
     def validate_guardian_phone(cls, v):
         """Validate phone number format"""
         # Remove all non-digit characters
-        digits_only = ''.join(filter(str.isdigit, v))
+        digits_only = NON_DIGIT_PATTERN.sub('', v)
         if len(digits_only) < 10:
             raise ValueError('Phone number must contain at least 10 digits')
         return v
     
-    @validator('guardian_email')
+    @field_validator('guardian_email')
+    @classmethod
     def validate_guardian_email(cls, v):
         """Validate email format if provided"""
-        if v is not None:
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, v):
-                raise ValueError('Invalid email format')
+        if v is not None and not EMAIL_PATTERN.match(v):
+            raise ValueError('Invalid email format')
         return v
     
-    @validator('child_age')
+    @field_validator('child_age')
+    @classmethod
     def validate_child_age(cls, v):
         """Validate child age"""
         if v < 0 or v > 18:
             raise ValueError('Child age must be between 0 and 18')
         return v
     
-    class Config:
-        """Pydantic configuration"""
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer('created_at', 'updated_at', 'generated_at', when_used='json')
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Serialize datetimes as ISO 8601 strings"""
+        return v.isoformat() if v is not None else None
+    
+    model_config = _COMPLAINT_CONFIG
 
 class ComplaintUpdate(BaseModel):
     """Model for updating complaint information"""
-    status: Optional[ComplaintStatus] = None
-    priority: Optional[PriorityLevel] = None
+    status: Optional[ComplaintStatusValue] = None
+    priority: Optional[PriorityLevelValue] = None
     notes: Optional[str] = None
     assigned_to: Optional[str] = None
     tags: Optional[List[str]] = None
     
-    class Config:
-        use_enum_values = True
+    model_config = _COMPLAINT_CONFIG
 
 class ComplaintSummary(BaseModel):
     """Summary model for complaint listing"""
     complaint_id: str
     child_name: str
-    incident_type: IncidentType
+    incident_type: IncidentTypeValue
     incident_date: str
-    status: ComplaintStatus
-    priority: PriorityLevel
+    status: ComplaintStatusValue
+    priority: PriorityLevelValue
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer('created_at', 'updated_at', when_used='json')
+    def serialize_datetime(self, v: Optional[datetime]) -> Optional[str]:
+        """Serialize datetimes as ISO 8601 strings"""
+        return v.isoformat() if v is not None else None
+    
+    model_config = _COMPLAINT_CONFIG
 
 class ComplaintStatistics(BaseModel):
     """Model for complaint statistics"""
@@ -193,18 +220,13 @@ class ComplaintStatistics(BaseModel):
     complaints_by_priority: Dict[str, int]
     complaints_by_month: Dict[str, int]
     average_resolution_time_days: Optional[float] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 class ComplaintSearch(BaseModel):
     """Model for complaint search parameters"""
     query: Optional[str] = None
-    incident_type: Optional[IncidentType] = None
-    status: Optional[ComplaintStatus] = None
-    priority: Optional[PriorityLevel] = None
+    incident_type: Optional[IncidentTypeValue] = None
+    status: Optional[ComplaintStatusValue] = None
+    priority: Optional[PriorityLevelValue] = None
     date_from: Optional[str] = None
     date_to: Optional[str] = None
     child_name: Optional[str] = None
@@ -213,5 +235,4 @@ class ComplaintSearch(BaseModel):
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
     
-    class Config:
-        use_enum_values = True
+    model_config = _COMPLAINT_CONFIG
@@ -1,9 +1,68 @@
-from pydantic import BaseModel, Field, validator, EmailStr
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, field_validator, EmailStr
+from typing import Annotated, Optional, List, Dict, Any, Sequence
+from datetime import datetime, date
 from enum import Enum
 import re
 
+# Precompiled validation patterns
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+DATE_PATTERN = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+_REQUIRED_EC_FIELDS = frozenset(('name', 'phone', 'relationship'))
+
+# Shared model configuration; enums stay as members after validation and are
+# stringified only when dumping with mode='json'
+_USER_CONFIG = ConfigDict(use_enum_values=False)
+# Response/query models are built once per row and never mutated
+_READ_ONLY_CONFIG = _USER_CONFIG | ConfigDict(frozen=True, extra='ignore')
+
+def _has_min_digits(v: str, minimum: int = 10) -> bool:
+    """Check that v contains at least `minimum` digits, stopping early once reached"""
+    count = 0
+    for c in v:
+        if c.isdigit():
+            count += 1
+            if count >= minimum:
+                return True
+    return False
+
+def _validate_email_shape(v: str) -> str:
+    """Lightweight email check for addresses that were fully validated on creation"""
+    if not EMAIL_PATTERN.fullmatch(v):
+        raise ValueError('Invalid email address')
+    return v
+
+# Used instead of EmailStr where the full email-validator check is redundant
+FastEmail = Annotated[str, AfterValidator(_validate_email_shape)]
+
+def _validate_password_strength(v: str) -> str:
+    """Shared password strength check for new passwords"""
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    
+    # Classify characters in a single pass, stopping once every class is seen
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if 'A' <= c <= 'Z':
+            has_upper = True
+        elif 'a' <= c <= 'z':
+            has_lower = True
+        elif c.isdecimal():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            break
+    
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not has_digit:
+        raise ValueError('Password must contain at least one number')
+    return v
+
 class UserRole(str, Enum):
     """Enumeration of user roles"""
     CHILD = "child"
@@ -34,6 +93,35 @@ class NotificationPreference(str, Enum):
     IN_APP = "in_app"
     NONE = "none"
 
+# Value -> member lookup tables so string input is coerced with a single dict get
+_ROLE_MAP = {member.value: member for member in UserRole}
+_STATUS_MAP = {member.value: member for member in UserStatus}
+_NOTIFICATION_MAP = {member.value: member for member in NotificationPreference}
+
+def _enum_coercer(lookup: Dict[str, Enum]):
+    """Build a before-validator that maps raw values to enum members"""
+    get = lookup.get
+    def coerce(v):
+        # Members and unknown values fall through to pydantic's enum check
+        return get(v, v) if type(v) is str else v
+    return coerce
+
+RoleField = Annotated[UserRole, BeforeValidator(_enum_coercer(_ROLE_MAP))]
+StatusField = Annotated[UserStatus, BeforeValidator(_enum_coercer(_STATUS_MAP))]
+NotificationField = Annotated[NotificationPreference, BeforeValidator(_enum_coercer(_NOTIFICATION_MAP))]
+
+class _ContactFields(BaseModel):
+    """Unconstrained contact and location fields shared by UserCreate and UserUpdate"""
+    phone_number: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    country: Optional[str] = None
+    postal_code: Optional[str] = None
+
+# Shared immutable default; tuples are safe to reuse across instances
+_DEFAULT_NOTIFICATION_PREFERENCES = (NotificationPreference.EMAIL,)
+
 class UserData(BaseModel):
     """Data model for user information"""
     
@@ -50,8 +138,8 @@ class UserData(BaseModel):
     gender: Optional[str] = Field(None, max_length=20, description="User's gender")
     
     # Role and status
-    role: UserRole = Field(..., description="User's role in the system")
-    status: UserStatus = Field(default=UserStatus.PENDING, description="Current status of the user account")
+    role: RoleField = Field(..., description="User's role in the system")
+    status: StatusField = Field(default=UserStatus.PENDING, description="Current status of the user account")
     is_verified: bool = Field(default=False, description="Whether the user's identity has been verified")
     
     # Contact and location
@@ -62,14 +150,14 @@ class UserData(BaseModel):
     postal_code: Optional[str] = Field(None, max_length=20, description="User's postal code")
     
     # Emergency contacts
-    emergency_contacts: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list, 
+    emergency_contacts: Optional[Sequence[Dict[str, Any]]] = Field(
+        default=(), 
         description="List of emergency contacts"
     )
     
     # Preferences and settings
-    notification_preferences: List[NotificationPreference] = Field(
-        default_factory=lambda: [NotificationPreference.EMAIL],
+    notification_preferences: Sequence[NotificationField] = Field(
+        default=_DEFAULT_NOTIFICATION_PREFERENCES,
         description="User's notification preferences"
     )
     language_preference: str = Field(default="en", max_length=10, description="Preferred language")
@@ -84,7 +172,7 @@ class UserData(BaseModel):
     # Profile information
     profile_picture: Optional[str] = Field(None, description="URL to profile picture")
     bio: Optional[str] = Field(None, max_length=500, description="User's biography or description")
-    interests: Optional[List[str]] = Field(default_factory=list, description="User's interests")
+    interests: Optional[Sequence[str]] = Field(default=(), description="User's interests")
     
     # System metadata
     created_at: Optional[datetime] = Field(None, description="When the user account was created")
@@ -92,115 +180,95 @@ class UserData(BaseModel):
     last_activity: Optional[datetime] = Field(None, description="Last activity timestamp")
     
     # Permissions and access control
-    permissions: Optional[List[str]] = Field(default_factory=list, description="User's permissions")
+    permissions: Optional[Sequence[str]] = Field(default=(), description="User's permissions")
     access_level: Optional[str] = Field(None, description="User's access level")
     
     # Validation methods
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
         """Validate username format"""
         if v is not None:
-            if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+            if not USERNAME_PATTERN.match(v):
                 raise ValueError('Username can only contain letters, numbers, underscores, and hyphens')
         return v
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone_number(cls, v):
         """Validate phone number format"""
-        if v is not None:
-            # Remove all non-digit characters
-            digits_only = ''.join(filter(str.isdigit, v))
-            if len(digits_only) < 10:
-                raise ValueError('Phone number must contain at least 10 digits')
+        if v is not None and not _has_min_digits(v):
+            raise ValueError('Phone number must contain at least 10 digits')
         return v
     
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_date_of_birth(cls, v):
         """Validate date of birth format"""
         if v is not None:
+            match = DATE_PATTERN.fullmatch(v)
             try:
-                datetime.strptime(v, '%Y-%m-%d')
-                return v
+                if not match:
+                    raise ValueError
+                # date() rejects impossible calendar dates such as 2023-02-30
+                date(*map(int, match.groups()))
             except ValueError:
                 raise ValueError('date_of_birth must be in YYYY-MM-DD format')
         return v
     
-    @validator('emergency_contacts')
+    @field_validator('emergency_contacts')
+    @classmethod
     def validate_emergency_contacts(cls, v):
         """Validate emergency contacts structure"""
         if v is not None:
             for contact in v:
-                if not isinstance(contact, dict):
+                if type(contact) is not dict:
                     raise ValueError('Emergency contacts must be a list of dictionaries')
-                required_fields = ['name', 'phone', 'relationship']
-                for field in required_fields:
-                    if field not in contact:
-                        raise ValueError(f'Emergency contact missing required field: {field}')
+                missing = _REQUIRED_EC_FIELDS.difference(contact)
+                if missing:
+                    # min() reports fields in the same order as before: name, phone, relationship
+                    raise ValueError(f'Emergency contact missing required field: {min(missing)}')
         return v
     
-    class Config:
-        """Pydantic configuration"""
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Datetimes use pydantic's native ISO 8601 serialization
+    model_config = _USER_CONFIG | ConfigDict(validate_assignment=True)
 
-class UserCreate(BaseModel):
+class UserCreate(_ContactFields):
     """Model for creating new users"""
     username: Optional[str] = None
     email: EmailStr
     password: str = Field(..., min_length=8, description="User's password")
     first_name: str
     last_name: str
-    role: UserRole
-    phone_number: Optional[str] = None
+    role: RoleField
     date_of_birth: Optional[str] = None
     gender: Optional[str] = None
-    address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    country: Optional[str] = None
-    postal_code: Optional[str] = None
     language_preference: str = "en"
     timezone: str = "UTC"
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        return v
+        return _validate_password_strength(v)
 
-class UserUpdate(BaseModel):
+class UserUpdate(_ContactFields):
     """Model for updating user information"""
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    phone_number: Optional[str] = None
     date_of_birth: Optional[str] = None
     gender: Optional[str] = None
-    address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    country: Optional[str] = None
-    postal_code: Optional[str] = None
     profile_picture: Optional[str] = None
     bio: Optional[str] = None
     interests: Optional[List[str]] = None
-    notification_preferences: Optional[List[NotificationPreference]] = None
+    notification_preferences: Optional[List[NotificationField]] = None
     language_preference: Optional[str] = None
     timezone: Optional[str] = None
     emergency_contacts: Optional[List[Dict[str, Any]]] = None
 
 class UserLogin(BaseModel):
     """Model for user login"""
-    email: EmailStr
+    email: FastEmail
     password: str
 
 class UserPasswordChange(BaseModel):
@@ -208,40 +276,11 @@ class UserPasswordChange(BaseModel):
     current_password: str
     new_password: str
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_new_password_strength(cls, v):
         """Validate new password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        return v
-
-class UserProfile(BaseModel):
-    """Model for user profile display"""
-    user_id: str
-    username: Optional[str]
-    first_name: str
-    last_name: str
-    email: EmailStr
-    role: UserRole
-    status: UserStatus
-    is_verified: bool
-    profile_picture: Optional[str]
-    bio: Optional[str]
-    interests: List[str]
-    created_at: datetime
-    last_activity: Optional[datetime]
-    
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+        return _validate_password_strength(v)
 
 class UserSummary(BaseModel):
     """Summary model for user listing"""
@@ -249,18 +288,25 @@ class UserSummary(BaseModel):
     username: Optional[str]
     first_name: str
     last_name: str
-    email: EmailStr
-    role: UserRole
-    status: UserStatus
+    email: FastEmail
+    role: RoleField
+    status: StatusField
     is_verified: bool
     created_at: datetime
     last_activity: Optional[datetime]
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = _READ_ONLY_CONFIG
+    
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "UserSummary":
+        """Build from server-side data that is already validated, skipping validation"""
+        return cls.model_construct(**data)
+
+class UserProfile(UserSummary):
+    """Model for user profile display"""
+    profile_picture: Optional[str]
+    bio: Optional[str]
+    interests: List[str]
 
 class EmergencyContact(BaseModel):
     """Model for emergency contact information"""
@@ -271,19 +317,21 @@ class EmergencyContact(BaseModel):
     address: Optional[str] = Field(None, max_length=500, description="Contact's address")
     is_primary: bool = Field(default=False, description="Whether this is the primary emergency contact")
     
-    @validator('phone')
+    model_config = _READ_ONLY_CONFIG
+    
+    @field_validator('phone')
+    @classmethod
     def validate_phone(cls, v):
         """Validate phone number format"""
-        digits_only = ''.join(filter(str.isdigit, v))
-        if len(digits_only) < 10:
+        if not _has_min_digits(v):
             raise ValueError('Phone number must contain at least 10 digits')
         return v
 
 class UserSearch(BaseModel):
     """Model for user search parameters"""
     query: Optional[str] = None
-    role: Optional[UserRole] = None
-    status: Optional[UserStatus] = None
+    role: Optional[RoleField] = None
+    status: Optional[StatusField] = None
     city: Optional[str] = None
     state: Optional[str] = None
     country: Optional[str] = None
@@ -293,5 +341,4 @@ class UserSearch(BaseModel):
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
     
-    class Config:
-        use_enum_values = True
+    model_config = _READ_ONLY_CONFIG
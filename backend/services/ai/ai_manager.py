@@ -1,5 +1,7 @@
 import os
-from typing import Dict, Any, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from .providers.openai_provider import OpenAIProvider
 from .providers.aiml_provider import AIMLProvider
@@ -8,9 +10,28 @@ from .providers.aiml_provider import AIMLProvider
 class AIManager:
     """Runtime-configurable AI provider manager"""
 
-    def __init__(self):
-        self.provider_name = os.getenv("AI_PROVIDER", "openai").lower()
+    def __init__(self, http_client: Optional[Any] = None, openai_max_retries: Optional[int] = None):
+        # Optional shared httpx.AsyncClient handed to the OpenAI provider
+        self.http_client = http_client
+        # None keeps the OpenAI SDK's own retry default
+        self.openai_max_retries = openai_max_retries
+        provider_name, default_config = self._load_env_config()
+        self.provider_name = provider_name
+        # Per-instance copies, since set_provider() updates them in place
         self.config: Dict[str, Any] = {
+            name: dict(cfg) for name, cfg in default_config.items()
+        }
+        # Providers keyed by (name, config), so switching back to a previous
+        # configuration reuses its client and connection pool
+        self._provider_cache: Dict[Tuple[str, frozenset], Any] = {}
+        self._provider = self._build_provider(self.provider_name)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_env_config() -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        """Read provider settings from the environment once per process"""
+        provider_name = sys.intern(os.getenv("AI_PROVIDER", "openai").lower())
+        return provider_name, {
             "openai": {
                 "api_key": os.getenv("OPENAI_API_KEY"),
                 "model": os.getenv("OPENAI_MODEL", "gpt-4")
@@ -21,15 +42,24 @@ class AIManager:
                 "model": os.getenv("AIML_MODEL", "default")
             }
         }
-        self._provider = self._build_provider(self.provider_name)
 
     def _build_provider(self, name: str):
-        if name == "aiml":
-            cfg = self.config["aiml"]
-            return AIMLProvider(cfg.get("base_url"), cfg.get("api_key"), cfg.get("model"))
-        # default: openai
-        cfg = self.config["openai"]
-        return OpenAIProvider(cfg.get("api_key"), cfg.get("model"))
+        if name != "aiml":
+            name = "openai"  # default
+        cfg = self.config[name]
+        key = (name, frozenset(
+            (k, v) for k, v in cfg.items()
+            if isinstance(v, (str, int, float, bool, type(None)))
+        ))
+        provider = self._provider_cache.get(key)
+        if provider is None:
+            if name == "aiml":
+                provider = AIMLProvider(cfg.get("base_url"), cfg.get("api_key"), cfg.get("model"))
+            else:
+                kwargs = {} if self.openai_max_retries is None else {"max_retries": self.openai_max_retries}
+                provider = OpenAIProvider(cfg.get("api_key"), cfg.get("model"), self.http_client, **kwargs)
+            self._provider_cache[key] = provider
+        return provider
 
     def get_provider(self):
         return self._provider
@@ -38,11 +68,25 @@ class AIManager:
         name = name.lower()
         if name not in ("openai", "aiml"):
             raise ValueError("Unsupported provider")
+        current = self.config[name]
         if cfg:
-            self.config[name].update(cfg)
+            merged = {**current, **cfg}
+            if name == self.provider_name and merged == current:
+                return
+            self.config[name] = merged
+        elif name == self.provider_name:
+            return
         self.provider_name = name
         self._provider = self._build_provider(name)
 
+    async def close(self) -> None:
+        """Release HTTP sessions held by cached providers"""
+        for provider in self._provider_cache.values():
+            close = getattr(provider, "close", None)
+            if close is not None:
+                await close()
+        self._provider_cache.clear()
+
     def get_config(self) -> Dict[str, Any]:
         return {
             "provider": self.provider_name,
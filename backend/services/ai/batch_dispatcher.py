@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Batch states that are still waiting on OpenAI
+_PENDING_BATCH_STATUSES = frozenset(("validating", "in_progress", "finalizing"))
+
+
+class BatchDispatcher:
+    """Queue chat-completion requests and submit them through the OpenAI Batch API"""
+
+    def __init__(
+        self,
+        client: Any,
+        batch_window_ms: int = 30_000,
+        batch_max_size: int = 100,
+        poll_interval: float = 60.0
+    ):
+        self.client = client
+        self.batch_window = batch_window_ms / 1000
+        self.batch_max_size = batch_max_size
+        self.poll_interval = poll_interval
+        self._buffer: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._full = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+
+    async def submit(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a /v1/chat/completions body and wait for its completion body"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.append((uuid.uuid4().hex, body, future))
+        if len(self._buffer) >= self.batch_max_size:
+            self._full.set()
+        return await future
+
+    async def _flush_loop(self) -> None:
+        while self._buffer:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.batch_window)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            items = self._buffer[:self.batch_max_size]
+            del self._buffer[:self.batch_max_size]
+            if self._buffer and len(self._buffer) >= self.batch_max_size:
+                self._full.set()
+            # Each batch polls independently so later requests are not held up
+            task = asyncio.create_task(self._run_batch(items))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, items: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        futures = {custom_id: future for custom_id, _, future in items}
+        try:
+            payload = b"\n".join(
+                orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                })
+                for custom_id, body, _ in items
+            )
+            input_file = await self.client.files.create(file=("batch.jsonl", payload), purpose="batch")
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            while batch.status in _PENDING_BATCH_STATUSES:
+                await asyncio.sleep(self.poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                result = orjson.loads(line)
+                future = futures.pop(result.get("custom_id"), None)
+                if future is None or future.done():
+                    continue
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    future.set_result(response.get("body") or {})
+                else:
+                    future.set_exception(RuntimeError(f"Batch request failed: {result.get('error') or response.get('status_code')}"))
+
+            if futures:
+                raise RuntimeError("Batch output is missing some requests")
+        except Exception as e:
+            logger.error(f"OpenAI batch dispatch failed: {e}")
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def close(self) -> None:
+        """Cancel pending flushes and in-flight batch polling"""
+        tasks = [task for task in (self._flush_task, *self._batch_tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for _, _, future in self._buffer:
+            if not future.done():
+                future.cancel()
+        self._buffer.clear()
@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+
+def make_cache_key(model: str, temperature: float, messages: List[Dict[str, str]]) -> str:
+    """Hash the model, temperature and whitespace/case-normalized messages"""
+    digest = hashlib.blake2b(f"{model}|{temperature}".encode(), digest_size=16)
+    for message in messages:
+        digest.update(b"\x00")
+        digest.update(message.get("role", "").encode())
+        digest.update(b"|")
+        digest.update(" ".join(message.get("content", "").split()).lower().encode())
+    return digest.hexdigest()
+
+
+class LFUCache:
+    """Thread-safe least-frequently-used cache with LRU tie-breaking"""
+
+    def __init__(self, capacity: int = 50_000):
+        self.capacity = capacity
+        self._values: Dict[Hashable, Any] = {}
+        self._counts: Dict[Hashable, int] = {}
+        # Keys grouped by use count; each bucket is ordered oldest-first
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_count = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _bump(self, key: Hashable) -> None:
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            if key not in self._values:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._bump(key)
+            return self._values[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            if key in self._values:
+                self._values[key] = value
+                self._bump(key)
+                return
+            if len(self._values) >= self.capacity:
+                bucket = self._buckets[self._min_count]
+                evicted, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._buckets[self._min_count]
+                del self._values[evicted]
+                del self._counts[evicted]
+            self._values[key] = value
+            self._counts[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_count = 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._counts.clear()
+            self._buckets.clear()
+            self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._values),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -1,9 +1,13 @@
 import os
+import asyncio
 import aiohttp
+import orjson
 from typing import List, Dict, Any, Optional
 
 from .base import AIProvider
 
+# Shared read-only fallback so calls without options allocate nothing
+_EMPTY_OPTS: Dict[str, Any] = {}
 
 class AIMLProvider:
     name = "aiml"
@@ -12,36 +16,57 @@ class AIMLProvider:
         self.base_url = base_url or os.getenv("AIML_BASE_URL", "http://localhost:8001")
         self.api_key = api_key or os.getenv("AIML_API_KEY")
         self.model = model or os.getenv("AIML_MODEL", "default")
+        # Endpoint URLs and headers are fixed for the provider's lifetime
+        base = self.base_url.rstrip('/')
+        self._chat_url = f"{base}/v1/chat/completions"
+        self._health_url = f"{base}/health"
+        self._headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        timeout=aiohttp.ClientTimeout(total=30),
+                        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+                    )
+        return self._session
 
     async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        url = f"{self.base_url.rstrip('/')}/v1/chat/completions"
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        opts = options or _EMPTY_OPTS
         payload = {
-            "model": (options or {}).get("model", self.model),
+            "model": opts.get("model", self.model),
             "messages": messages,
-            "temperature": (options or {}).get("temperature", 0.7),
-            "max_tokens": (options or {}).get("max_tokens", 1000)
+            "temperature": opts.get("temperature", 0.7),
+            "max_tokens": opts.get("max_tokens", 1000)
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, timeout=30) as resp:
-                if resp.status != 200:
-                    return {"success": False, "error": f"AIML API error: {resp.status}"}
-                data = await resp.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                return {"success": True, "content": content, "raw": data, "model": payload["model"]}
+        session = await self._get_session()
+        async with session.post(self._chat_url, data=orjson.dumps(payload), headers=self._headers, timeout=30) as resp:
+            if resp.status != 200:
+                return {"success": False, "error": f"AIML API error: {resp.status}"}
+            data = orjson.loads(await resp.read())
+            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+            return {"success": True, "content": content, "raw": data, "model": payload["model"]}
 
     async def complete(self, prompt: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return await self.chat([{"role": "user", "content": prompt}], options)
 
     async def health(self) -> Dict[str, Any]:
         try:
-            url = f"{self.base_url.rstrip('/')}/health"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=5) as resp:
-                    return {"status": "healthy" if resp.status == 200 else "unhealthy"}
+            session = await self._get_session()
+            async with session.get(self._health_url, timeout=5) as resp:
+                return {"status": "healthy" if resp.status == 200 else "unhealthy"}
         except Exception as e:
             return {"status": "unavailable", "error": str(e)}
 
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
 
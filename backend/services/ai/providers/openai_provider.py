@@ -1,37 +1,109 @@
 import os
-from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
+from typing import AsyncIterator, List, Dict, Any, Optional
+import httpx
+import orjson
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError, DEFAULT_MAX_RETRIES
 
 from .base import AIProvider
 
+# Shared read-only fallback so calls without options allocate nothing
+_EMPTY_OPTS: Dict[str, Any] = {}
 
 class OpenAIProvider:
     name = "openai"
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4")
-        self.client = AsyncOpenAI(api_key=self.api_key) if self.api_key else None
+        # http_client lets callers share one connection pool across clients
+        self.client = AsyncOpenAI(
+            api_key=self.api_key, http_client=http_client, max_retries=max_retries
+        ) if self.api_key else None
+        # With a shared pool, chat() posts orjson bodies directly on it instead
+        # of going through the SDK's stdlib-json request pipeline
+        self._http = http_client if self.client else None
+        if self._http is not None:
+            self._chat_url = f"{str(self.client.base_url).rstrip('/')}/chat/completions"
+            self._headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+
+    async def _post_chat(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """POST a chat completion on the shared pool; errors map to the SDK's exception types"""
+        try:
+            r = await self._http.post(self._chat_url, content=orjson.dumps(payload), headers=self._headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise APITimeoutError(request=e.request) from e
+        except httpx.TransportError as e:
+            raise APIConnectionError(request=e.request) from e
+        if r.status_code >= 400:
+            # Error bodies are not always JSON (e.g. gateway HTML), so keep them raw
+            raise APIStatusError(f"OpenAI API error: {r.status_code}", response=r, body=r.text)
+        return orjson.loads(r.content)
 
     async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if not self.client:
             return {"success": False, "error": "OpenAI API key not configured"}
-        opts = options or {}
+        opts = options or _EMPTY_OPTS
+        model = opts.get("model", self.model)
+        if self._http is not None:
+            data = await self._post_chat({
+                "model": model,
+                "messages": messages,
+                "max_tokens": opts.get("max_tokens", 1000),
+                "temperature": opts.get("temperature", 0.7),
+            }, opts.get("timeout", 30.0))
+            choices = data.get("choices") or [{}]
+            return {
+                "success": True,
+                "content": (choices[0].get("message") or {}).get("content") or "",
+                "usage": data.get("usage"),
+                "model": model
+            }
         resp = await self.client.chat.completions.create(
-            model=opts.get("model", self.model),
+            model=model,
             messages=messages,
             max_tokens=opts.get("max_tokens", 1000),
             temperature=opts.get("temperature", 0.7),
             timeout=opts.get("timeout", 30.0),
         )
-        content = resp.choices[0].message.content if resp.choices and resp.choices[0].message else ""
+        try:
+            content = resp.choices[0].message.content or ""
+        except IndexError:
+            content = ""
         return {
             "success": True,
             "content": content,
-            "usage": getattr(resp, "usage", None),
-            "model": opts.get("model", self.model)
+            "usage": resp.usage,
+            "model": model
         }
 
+    async def chat_stream(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield {"delta": text} chunks as they arrive, then a final {"usage": ...}"""
+        if not self.client:
+            raise RuntimeError("OpenAI API key not configured")
+        opts = options or _EMPTY_OPTS
+        stream = await self.client.chat.completions.create(
+            model=opts.get("model", self.model),
+            messages=messages,
+            max_tokens=opts.get("max_tokens", 1000),
+            temperature=opts.get("temperature", 0.7),
+            timeout=opts.get("timeout", 30.0),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        usage = None
+        async for chunk in stream:
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield {"delta": chunk.choices[0].delta.content}
+        yield {"usage": usage}
+
     async def complete(self, prompt: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         # For simplicity, reuse chat with single user message
         return await self.chat([{"role": "user", "content": prompt}], options)
@@ -1,9 +1,17 @@
 import os
+import re
 import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
-from openai import AsyncOpenAI
+import random
+import time
+from itertools import islice
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Any, Tuple
+import httpx
+import aiohttp
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
 from openai.types.chat import ChatCompletion
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
@@ -12,55 +20,314 @@ from backend.models.complaintModel import ComplaintData
 from utils.textCleaner import TextCleaner
 from utils.timeUtils import TimeUtils
 from backend.services.ai.ai_manager import AIManager
+from backend.services.ai.llm_cache import LFUCache, make_cache_key
+from backend.services.ai.batch_dispatcher import BatchDispatcher
 
 logger = logging.getLogger(__name__)
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Complaint drafts that can wait longer than this go through the Batch API
+BATCH_LATENCY_THRESHOLD_MS = 60_000
+
+# Low-risk chatbot turns up to this length go to the smaller model with a
+# shorter reply budget
+LOW_TIER_MAX_MESSAGE_CHARS = 280
+LOW_TIER_MAX_TOKENS = 256
+
+# Provider calls are retried on transient failures with capped exponential backoff
+MAX_RETRIES = 3
+MAX_RETRY_SLEEP = 20.0
+RETRYABLE_STATUS_CODES = frozenset((408, 409, 429, 500, 502, 503, 504))
+
+# Seconds a healthy health-check result is reused before probing again
+HEALTHCHECK_TTL = 10.0
+
+BASE_SYSTEM_PROMPT = """You are SafeChild, a friendly and supportive AI companion designed to help children learn about safety and provide guidance in difficult situations.
+
+Your core responsibilities:
+1. Provide age-appropriate safety education
+2. Offer emotional support and guidance
+3. Direct children to trusted adults when needed
+4. Maintain a calm, reassuring tone
+5. Never provide medical or legal advice
+
+Safety guidelines:
+- Always prioritize child safety
+- Encourage communication with trusted adults
+- Provide clear, simple explanations
+- Use positive reinforcement
+- Maintain appropriate boundaries
+
+Emergency response:
+- If a child mentions immediate danger, guide them to call emergency services
+- Encourage them to tell a trusted adult immediately
+- Provide clear next steps for safety
+
+Remember: You are a supportive companion, not a replacement for professional help or trusted adults."""
+
+COMPLAINT_PROMPT_TEMPLATE = """Generate a {template_type} complaint draft based on the following incident data:
+
+Incident Type: {incident_type}
+Priority Level: {priority}
+Date: {date}
+
+Child Information:
+- Age: {child_age}
+- Gender: {child_gender}
+
+Incident Details:
+{description}
+
+Guardian Information:
+- Name: {guardian_name}
+- Contact: {guardian_contact}
+
+Please generate a professional, clear, and legally appropriate complaint draft that includes:
+1. Clear incident description
+2. Relevant details and context
+3. Requested actions or outcomes
+4. Professional tone and language
+
+Template Style: {template_type}"""
+
+ANALYSIS_PROMPT_TEMPLATE = """Analyze the following safety concern and provide guidance:
+
+Concern Text: {concern_text}
+Analysis Type: {analysis_type}
+
+Please provide:
+1. Risk assessment and level
+2. Immediate safety recommendations
+3. Long-term safety measures
+4. When to seek professional help
+5. Resources and support options
+
+Focus on practical, actionable advice that prioritizes child safety."""
+
+FALLBACK_COMPLAINT_TEMPLATE = """COMPLAINT DRAFT - {template_type}
+
+Date: {timestamp}
+Incident Type: {incident_type}
+Priority: {priority}
+
+DESCRIPTION:
+{description}
+
+CHILD INFORMATION:
+Age: {child_age}
+Gender: {child_gender}
+
+GUARDIAN INFORMATION:
+Name: {guardian_name}
+Contact: {guardian_contact}
+
+REQUESTED ACTION:
+Please investigate this incident and take appropriate action to ensure child safety.
+
+Note: This is a fallback draft. For more detailed legal assistance, please consult with a legal professional."""
+
+# System messages are shared across requests and must not be mutated
+COMPLAINT_SYSTEM_MESSAGE = {"role": "system", "content": "You are a legal document generator specializing in child safety incident reports. Generate professional, clear, and legally appropriate complaint drafts."}
+ANALYSIS_SYSTEM_MESSAGE = {"role": "system", "content": "You are a child safety expert. Analyze safety concerns and provide appropriate guidance and recommendations."}
+BASE_SYSTEM_MESSAGE = {"role": "system", "content": BASE_SYSTEM_PROMPT}
+
+# Fields that default to something other than "Unknown" in the complaint prompt
+_COMPLAINT_PROMPT_DEFAULTS = {"priority": "Medium", "description": "No description provided"}
+_FALLBACK_COMPLAINT_DEFAULTS = {
+    "incident_type": "Child Safety Incident",
+    "priority": "Medium",
+    "description": "Incident description not provided"
+}
+
+
+class _PromptFields(dict):
+    """format_map mapping that renders absent fields as 'Unknown'"""
+    
+    def __missing__(self, key: str) -> str:
+        return "Unknown"
+
+
+@lru_cache(maxsize=256)
+def _user_context_prompt_for(age_group: str, topics: tuple) -> str:
+    """Second system message describing a user's age group and focus areas"""
+    parts = []
+    if age_group:
+        parts.append(f"User age group: {age_group}")
+    if topics:
+        parts.append(f"Focus areas: {', '.join(topics)}")
+    return "\n".join(parts)
+
+def _tokens_used(usage: Any) -> Optional[int]:
+    """total_tokens from a provider usage object or dict"""
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        return usage.get("total_tokens")
+    return getattr(usage, "total_tokens", None)
+
+# A sentence is complete once terminal punctuation is followed by whitespace
+SENTENCE_END_PATTERN = re.compile(r"[.!?]\s")
+
+@lru_cache(maxsize=8)
+def _encoding_for(model: str):
+    """tiktoken encoding for a model, falling back to cl100k_base for unknown names;
+    None when the BPE file cannot be loaded (e.g. offline), cached so it isn't retried per call"""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(model: str, text: str) -> int:
+    """Token count of text; history entries repeat every turn so counts are memoized"""
+    if TIKTOKEN_AVAILABLE:
+        try:
+            encoding = _encoding_for(model)
+            if encoding is not None:
+                return len(encoding.encode(text))
+        except Exception as e:
+            logger.warning(f"Token counting failed, estimating instead: {e}")
+    # Rough estimate of ~4 characters per token without tiktoken
+    return len(text) // 4 + 1
+
+# Bulleted or numbered lines in an analysis; group 1 is the item text
+RECOMMENDATION_PATTERN = re.compile(r"(?m)^\s*(?:[-•*]|\d+\.)\s*(.+?)\s*$")
+
+# Short inputs (greetings, form fields) repeat often, so their cleaned form is memoized
+CLEAN_TEXT_CACHE_MAX_LEN = 256
+_shared_text_cleaner = TextCleaner()
+
+
+@lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> str:
+    return _shared_text_cleaner.clean_text(text)
+
+# Risk keywords compiled into one alternation per level; matched as substrings
+# like the original `keyword in text` checks
+HIGH_RISK_PATTERN = re.compile("|".join(map(re.escape, (
+    "immediate danger", "emergency", "hurt", "pain", "bleeding",
+    "unconscious", "choking", "poison", "fire", "weapon"
+))), re.IGNORECASE)
+MEDIUM_RISK_PATTERN = re.compile("|".join(map(re.escape, (
+    "uncomfortable", "scared", "worried", "strange", "suspicious",
+    "bullying", "harassment", "inappropriate", "touch"
+))), re.IGNORECASE)
+
 class GPTService:
     """Service for OpenAI GPT API interactions"""
     
+    # Fallback responses for when GPT is unavailable; shared and read-only
+    fallback_responses = MappingProxyType({
+        "greeting": (
+            "Hello! I'm SafeChild, your safety companion. How can I help you today?",
+            "Hi there! I'm here to help you stay safe. What would you like to know?",
+            "Welcome! I'm SafeChild, ready to help with safety questions and concerns."
+        ),
+        "safety_tip": (
+            "Remember: Your body belongs to you. No one should touch you in ways that make you uncomfortable.",
+            "Always tell a trusted adult if something doesn't feel right.",
+            "It's okay to say 'NO' if someone makes you feel unsafe or uncomfortable."
+        ),
+        "emergency": (
+            "If you're in immediate danger, call emergency services right away.",
+            "Tell a trusted adult immediately if you feel unsafe.",
+            "Your safety is the most important thing. Don't hesitate to ask for help."
+        ),
+        "general": (
+            "I'm here to help you learn about safety. What specific question do you have?",
+            "That's a great question about safety. Let me help you understand this better.",
+            "Safety is important for everyone. I'm happy to help you learn more."
+        )
+    })
+    
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.model = os.getenv("OPENAI_MODEL", "gpt-4")
         self.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "1000"))
         self.temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+        # Chatbot model tiers: small model for low-risk turns, main model otherwise
+        self.model_low = os.getenv("OPENAI_MODEL_LOW", "gpt-4o-mini")
+        self.model_high = os.getenv("OPENAI_MODEL_HIGH", self.model)
+        # Token budget for chat history sent with each chatbot turn
+        self.ctx_budget = int(os.getenv("OPENAI_CTX_BUDGET", "3000"))
         
-        # AI manager/provider
-        self.ai_manager = AIManager()
+        # One keep-alive connection pool shared by every OpenAI client
+        self._http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=200, max_connections=500, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(30.0, connect=3.0)
+        )
+        
+        # AI manager/provider; retries are handled by _chat_with_retry, so the
+        # SDK's own retry loop is disabled to avoid compounding attempts
+        self.ai_manager = AIManager(http_client=self._http, openai_max_retries=0)
         # Keep OpenAI client for health-check legacy path
         if self.api_key:
             try:
-                self.client = AsyncOpenAI(api_key=self.api_key)
+                self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
             except Exception:
                 self.client = None
         else:
             self.client = None
         
+        # Provider options are fixed per instance, so build them once
+        self._chat_opts = MappingProxyType({
+            "model": self.model_high,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "timeout": 30.0
+        })
+        self._chat_opts_low = MappingProxyType({
+            "model": self.model_low,
+            "max_tokens": min(LOW_TIER_MAX_TOKENS, self.max_tokens),
+            "temperature": self.temperature,
+            "timeout": 30.0
+        })
+        self._complaint_opts = MappingProxyType({
+            "model": self.model,
+            "max_tokens": self.max_tokens * 2,
+            "temperature": 0.3,
+            "timeout": 60.0
+        })
+        self._analysis_opts = MappingProxyType({
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": 0.5,
+            "timeout": 45.0
+        })
+        
+        # Caps concurrent provider calls made by the bulk helpers
+        self._sem = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "10")))
+        
+        # Non-interactive requests are queued for the cheaper Batch API
+        self.batch_dispatcher = BatchDispatcher(self.client) if self.client else None
+        
         self.text_cleaner = TextCleaner()
         self.time_utils = TimeUtils()
         
-        # Fallback responses for when GPT is unavailable
-        self.fallback_responses = {
-            "greeting": [
-                "Hello! I'm SafeChild, your safety companion. How can I help you today?",
-                "Hi there! I'm here to help you stay safe. What would you like to know?",
-                "Welcome! I'm SafeChild, ready to help with safety questions and concerns."
-            ],
-            "safety_tip": [
-                "Remember: Your body belongs to you. No one should touch you in ways that make you uncomfortable.",
-                "Always tell a trusted adult if something doesn't feel right.",
-                "It's okay to say 'NO' if someone makes you feel unsafe or uncomfortable."
-            ],
-            "emergency": [
-                "If you're in immediate danger, call emergency services right away.",
-                "Tell a trusted adult immediately if you feel unsafe.",
-                "Your safety is the most important thing. Don't hesitate to ask for help."
-            ],
-            "general": [
-                "I'm here to help you learn about safety. What specific question do you have?",
-                "That's a great question about safety. Let me help you understand this better.",
-                "Safety is important for everyone. I'm happy to help you learn more."
-            ]
-        }
+        # Provider responses keyed by model, temperature and normalized messages
+        cache_size = int(os.getenv("GPT_CACHE_SIZE", "50000"))
+        self._chat_cache = LFUCache(cache_size)
+        self._analysis_cache = LFUCache(cache_size)
+        
+        # (monotonic time, result) of the last healthy probe
+        self._hc_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
     async def get_chatbot_response(
         self, 
@@ -73,7 +340,7 @@ class GPTService:
             provider = self.ai_manager.get_provider()
             
             # Clean and validate input
-            cleaned_message = self.text_cleaner.clean_text(message)
+            cleaned_message = self._fast_clean(message)
             if not cleaned_message:
                 return {
                     "success": False,
@@ -84,25 +351,29 @@ class GPTService:
             # Prepare conversation context
             messages = self._prepare_conversation_context(cleaned_message, chat_history, user_context)
             
-            # Call OpenAI API
-            ai = await provider.chat(messages, {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "timeout": 30.0
-            })
+            # Call OpenAI API unless an identical conversation was answered before
+            options = self._choose_model(cleaned_message, self._assess_risk_level(cleaned_message))
+            cache_key = make_cache_key(options["model"], options["temperature"], messages)
+            ai = self._chat_cache.get(cache_key)
+            cached = ai is not None
+            if not cached:
+                ai = await self._chat_with_retry(provider, messages, options)
+                if ai.get("content"):
+                    self._chat_cache.put(cache_key, ai)
             ai_response = ai.get("content")
             if not ai_response:
                 return await self._get_fallback_response(message, "general")
             
             # Clean and validate response
-            cleaned_response = self.text_cleaner.clean_text(ai_response)
+            cleaned_response = self._fast_clean(ai_response)
             
             return {
                 "success": True,
                 "response": cleaned_response,
                 "model": ai.get("model"),
-                "tokens_used": ai.get("usage", {}).get("total_tokens") if ai.get("usage") else None,
+                # Cached replies cost no provider tokens
+                "tokens_used": 0 if cached else _tokens_used(ai.get("usage")),
+                "cached": cached,
                 "timestamp": self.time_utils.get_current_timestamp()
             }
             
@@ -110,12 +381,109 @@ class GPTService:
             logger.error(f"Error getting chatbot response: {e}")
             return await self._get_fallback_response(message, "general")
     
+    async def stream_chatbot_response(
+        self, 
+        message: str, 
+        chat_history: List[Dict[str, str]], 
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream chatbot response from GPT API as cleaned sentence chunks
+        
+        Yields {"success": True, "delta": ...} per completed sentence and ends
+        with a {"done": True, ...} event carrying the full cleaned response.
+        """
+        cleaned_message = self._fast_clean(message)
+        if not cleaned_message:
+            yield {
+                "success": False,
+                "done": True,
+                "error": "Invalid message content",
+                "response": "I couldn't understand your message. Could you please rephrase it?"
+            }
+            return
+        
+        chunks: List[str] = []
+        usage = None
+        cached = None
+        
+        try:
+            messages = self._prepare_conversation_context(cleaned_message, chat_history, user_context)
+            options = self._choose_model(cleaned_message, self._assess_risk_level(cleaned_message))
+            cache_key = make_cache_key(options["model"], options["temperature"], messages)
+            cached = self._chat_cache.get(cache_key)
+            provider = self.ai_manager.get_provider()
+            chat_stream = getattr(provider, "chat_stream", None)
+            if cached is not None:
+                events = self._single_event_stream(cached)
+            elif chat_stream is not None:
+                events = chat_stream(messages, options)
+            else:
+                events = self._single_event_stream(await self._chat_with_retry(provider, messages, options))
+            
+            raw: List[str] = []
+            buffer = ""
+            async for event in events:
+                if "usage" in event:
+                    usage = event["usage"]
+                delta = event.get("delta")
+                if not delta:
+                    continue
+                raw.append(delta)
+                buffer += delta
+                # Flush everything up to the last complete sentence
+                last_end = None
+                for last_end in SENTENCE_END_PATTERN.finditer(buffer):
+                    pass
+                if last_end is not None:
+                    sentence, buffer = buffer[:last_end.end()], buffer[last_end.end():]
+                    cleaned = self._fast_clean(sentence)
+                    if cleaned:
+                        chunks.append(cleaned)
+                        yield {"success": True, "delta": cleaned}
+            
+            cleaned = self._fast_clean(buffer)
+            if cleaned:
+                chunks.append(cleaned)
+                yield {"success": True, "delta": cleaned}
+            
+            if not chunks:
+                yield {**(await self._get_fallback_response(message, "general")), "done": True}
+                return
+            if cached is None:
+                self._chat_cache.put(cache_key, {"content": "".join(raw), "model": options["model"], "usage": usage})
+        except Exception as e:
+            logger.error(f"Error streaming chatbot response: {e}")
+            if not chunks:
+                yield {**(await self._get_fallback_response(message, "general")), "done": True}
+                return
+        
+        yield {
+            "success": True,
+            "done": True,
+            "response": " ".join(chunks),
+            "model": options["model"],
+            "tokens_used": 0 if cached is not None else _tokens_used(usage),
+            "cached": cached is not None,
+            "timestamp": self.time_utils.get_current_timestamp()
+        }
+    
+    @staticmethod
+    async def _single_event_stream(ai: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Adapt a complete provider reply to the streaming event shape"""
+        yield {"delta": ai.get("content") or ""}
+        yield {"usage": ai.get("usage")}
+    
     async def generate_complaint_draft(
         self, 
         incident_data: Dict[str, Any], 
-        template_type: str = "formal"
+        template_type: str = "formal",
+        latency_budget_ms: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Generate complaint draft using GPT API"""
+        """Generate complaint draft using GPT API
+        
+        Callers that can wait longer than BATCH_LATENCY_THRESHOLD_MS may pass
+        latency_budget_ms to have the draft generated through the Batch API.
+        """
         try:
             provider = self.ai_manager.get_provider()
             
@@ -125,29 +493,42 @@ class GPTService:
             # Prepare prompt for complaint generation
             prompt = self._prepare_complaint_prompt(cleaned_data, template_type)
             
-            # Call OpenAI API
-            ai = await provider.chat([
-                {"role": "system", "content": "You are a legal document generator specializing in child safety incident reports. Generate professional, clear, and legally appropriate complaint drafts."},
-                {"role": "user", "content": prompt}
-            ], {
-                "model": self.model,
-                "max_tokens": self.max_tokens * 2,
-                "temperature": 0.3,
-                "timeout": 60.0
-            })
+            messages = [COMPLAINT_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+            
+            if (
+                latency_budget_ms is not None
+                and latency_budget_ms > BATCH_LATENCY_THRESHOLD_MS
+                and self.batch_dispatcher is not None
+                and self.ai_manager.provider_name == "openai"
+            ):
+                body = await self.batch_dispatcher.submit({
+                    "model": self.model,
+                    "messages": messages,
+                    "max_tokens": self.max_tokens * 2,
+                    "temperature": 0.3
+                })
+                choices = body.get("choices") or [{}]
+                ai = {
+                    "content": (choices[0].get("message") or {}).get("content"),
+                    "model": body.get("model", self.model),
+                    "usage": body.get("usage")
+                }
+            else:
+                # Call OpenAI API
+                ai = await self._chat_with_retry(provider, messages, self._complaint_opts)
             complaint_draft = ai.get("content")
             if not complaint_draft:
                 return await self._generate_fallback_complaint(incident_data, template_type)
             
             # Clean and validate response
-            cleaned_draft = self.text_cleaner.clean_text(complaint_draft)
+            cleaned_draft = self._fast_clean(complaint_draft)
             
             return {
                 "success": True,
                 "complaint_draft": cleaned_draft,
                 "template_type": template_type,
                 "model": ai.get("model"),
-                "tokens_used": ai.get("usage", {}).get("total_tokens") if ai.get("usage") else None,
+                "tokens_used": _tokens_used(ai.get("usage")),
                 "timestamp": self.time_utils.get_current_timestamp(),
                 "metadata": {
                     "incident_type": cleaned_data.get("incident_type"),
@@ -170,7 +551,7 @@ class GPTService:
             provider = self.ai_manager.get_provider()
             
             # Clean input text
-            cleaned_text = self.text_cleaner.clean_text(concern_text)
+            cleaned_text = self._fast_clean(concern_text)
             if not cleaned_text:
                 return {
                     "success": False,
@@ -181,29 +562,31 @@ class GPTService:
             # Prepare analysis prompt
             prompt = self._prepare_analysis_prompt(cleaned_text, analysis_type)
             
-            # Call OpenAI API
-            ai = await provider.chat([
-                {"role": "system", "content": "You are a child safety expert. Analyze safety concerns and provide appropriate guidance and recommendations."},
-                {"role": "user", "content": prompt}
-            ], {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": 0.5,
-                "timeout": 45.0
-            })
+            messages = [ANALYSIS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+            
+            # Call OpenAI API unless the same concern was analyzed before
+            opts = self._analysis_opts
+            cache_key = make_cache_key(opts["model"], opts["temperature"], messages)
+            ai = self._analysis_cache.get(cache_key)
+            cached = ai is not None
+            if not cached:
+                ai = await self._chat_with_retry(provider, messages, opts)
+                if ai.get("content"):
+                    self._analysis_cache.put(cache_key, ai)
             analysis = ai.get("content")
             if not analysis:
                 return await self._get_fallback_safety_analysis(concern_text, analysis_type)
             
             # Clean and validate response
-            cleaned_analysis = self.text_cleaner.clean_text(analysis)
+            cleaned_analysis = self._fast_clean(analysis)
             
             return {
                 "success": True,
                 "analysis": cleaned_analysis,
                 "analysis_type": analysis_type,
                 "model": ai.get("model"),
-                "tokens_used": ai.get("usage", {}).get("total_tokens") if ai.get("usage") else None,
+                "tokens_used": 0 if cached else _tokens_used(ai.get("usage")),
+                "cached": cached,
                 "timestamp": self.time_utils.get_current_timestamp(),
                 "risk_level": self._assess_risk_level(cleaned_text),
                 "recommendations": self._extract_recommendations(cleaned_analysis)
@@ -213,6 +596,60 @@ class GPTService:
             logger.error(f"Error analyzing safety concern: {e}")
             return await self._get_fallback_safety_analysis(concern_text, analysis_type)
     
+    async def _chat_with_retry(self, provider: Any, messages: List[Dict[str, str]], options: Mapping[str, Any]) -> Dict[str, Any]:
+        """provider.chat with retries on timeouts, connection errors and retryable statuses"""
+        for attempt in range(MAX_RETRIES):
+            try:
+                return await provider.chat(messages, options)
+            except (APIConnectionError, APIStatusError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = getattr(e, "status_code", None)
+                if attempt == MAX_RETRIES - 1 or (status is not None and status not in RETRYABLE_STATUS_CODES):
+                    raise
+                delay = min(MAX_RETRY_SLEEP, 2 ** attempt + random.random())
+                response = getattr(e, "response", None)
+                retry_after = response.headers.get("retry-after") if response is not None else None
+                if retry_after:
+                    try:
+                        delay = min(MAX_RETRY_SLEEP, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning(f"Provider call failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    def _choose_model(self, message: str, risk: str) -> Mapping[str, Any]:
+        """Chat options for a turn: the small model for short low-risk messages,
+        the main model for medium/high risk or long messages"""
+        if risk == "low" and len(message) <= LOW_TIER_MAX_MESSAGE_CHARS:
+            return self._chat_opts_low
+        return self._chat_opts
+    
+    async def _guarded(self, coro):
+        """Await coro while holding a concurrency slot"""
+        async with self._sem:
+            return await coro
+    
+    async def analyze_safety_concerns_bulk(
+        self, 
+        texts: List[str], 
+        analysis_type: str = "general"
+    ) -> List[Any]:
+        """Analyze several safety concerns concurrently, in input order"""
+        return await asyncio.gather(
+            *(self._guarded(self.analyze_safety_concern(text, analysis_type)) for text in texts),
+            return_exceptions=True
+        )
+    
+    async def generate_complaint_drafts_bulk(
+        self, 
+        items: List[Dict[str, Any]], 
+        template_type: str = "formal"
+    ) -> List[Any]:
+        """Generate several complaint drafts concurrently, in input order"""
+        return await asyncio.gather(
+            *(self._guarded(self.generate_complaint_draft(item, template_type)) for item in items),
+            return_exceptions=True
+        )
+    
     def _prepare_conversation_context(
         self, 
         message: str, 
@@ -222,54 +659,40 @@ class GPTService:
         """Prepare conversation context for GPT API"""
         messages = []
         
-        # Add system message
-        system_message = self._get_system_prompt(user_context)
-        messages.append({"role": "system", "content": system_message})
+        # Static system message first so provider-side prompt caching can
+        # reuse it; per-user context follows as its own message
+        messages.append(BASE_SYSTEM_MESSAGE)
+        context_message = self._get_user_context_prompt(user_context)
+        if context_message:
+            messages.append({"role": "system", "content": context_message})
         
-        # Add chat history (limit to last 10 messages to avoid token limits)
-        for msg in chat_history[-10:]:
-            if msg.get("role") == "user":
-                messages.append({"role": "user", "content": msg.get("content", "")})
-            elif msg.get("role") == "assistant":
-                messages.append({"role": "assistant", "content": msg.get("content", "")})
+        # Add the newest chat history that fits the token budget
+        budget = self.ctx_budget
+        history = []
+        for msg in reversed(chat_history):
+            role = msg.get("role")
+            if role != "user" and role != "assistant":
+                continue
+            content = msg.get("content", "")
+            budget -= _count_tokens(self.model, content)
+            if budget < 0:
+                break
+            history.append({"role": role, "content": content})
+        messages.extend(reversed(history))
         
         # Add current message
         messages.append({"role": "user", "content": message})
         
         return messages
     
-    def _get_system_prompt(self, user_context: Optional[Dict[str, Any]] = None) -> str:
-        """Get system prompt for GPT API"""
-        base_prompt = """You are SafeChild, a friendly and supportive AI companion designed to help children learn about safety and provide guidance in difficult situations.
-
-Your core responsibilities:
-1. Provide age-appropriate safety education
-2. Offer emotional support and guidance
-3. Direct children to trusted adults when needed
-4. Maintain a calm, reassuring tone
-5. Never provide medical or legal advice
-
-Safety guidelines:
-- Always prioritize child safety
-- Encourage communication with trusted adults
-- Provide clear, simple explanations
-- Use positive reinforcement
-- Maintain appropriate boundaries
-
-Emergency response:
-- If a child mentions immediate danger, guide them to call emergency services
-- Encourage them to tell a trusted adult immediately
-- Provide clear next steps for safety
-
-Remember: You are a supportive companion, not a replacement for professional help or trusted adults."""
-
-        if user_context:
-            if user_context.get("age_group"):
-                base_prompt += f"\n\nUser age group: {user_context['age_group']}"
-            if user_context.get("safety_topics"):
-                base_prompt += f"\n\nFocus areas: {', '.join(user_context['safety_topics'])}"
-        
-        return base_prompt
+    def _get_user_context_prompt(self, user_context: Optional[Dict[str, Any]] = None) -> str:
+        """Get user context message for GPT API, or an empty string if there is none"""
+        if not user_context:
+            return ""
+        return _user_context_prompt_for(
+            user_context.get("age_group") or "",
+            tuple(sorted(user_context.get("safety_topics") or ()))
+        )
     
     def _prepare_complaint_prompt(
         self, 
@@ -277,50 +700,14 @@ Remember: You are a supportive companion, not a replacement for professional hel
         template_type: str
     ) -> str:
         """Prepare prompt for complaint generation"""
-        prompt = f"""Generate a {template_type} complaint draft based on the following incident data:
-
-Incident Type: {incident_data.get('incident_type', 'Unknown')}
-Priority Level: {incident_data.get('priority', 'Medium')}
-Date: {incident_data.get('date', 'Unknown')}
-
-Child Information:
-- Age: {incident_data.get('child_age', 'Unknown')}
-- Gender: {incident_data.get('child_gender', 'Unknown')}
-
-Incident Details:
-{incident_data.get('description', 'No description provided')}
-
-Guardian Information:
-- Name: {incident_data.get('guardian_name', 'Unknown')}
-- Contact: {incident_data.get('guardian_contact', 'Unknown')}
-
-Please generate a professional, clear, and legally appropriate complaint draft that includes:
-1. Clear incident description
-2. Relevant details and context
-3. Requested actions or outcomes
-4. Professional tone and language
-
-Template Style: {template_type}"""
-
-        return prompt
+        fields = _PromptFields(_COMPLAINT_PROMPT_DEFAULTS)
+        fields.update(incident_data)
+        fields["template_type"] = template_type
+        return COMPLAINT_PROMPT_TEMPLATE.format_map(fields)
     
     def _prepare_analysis_prompt(self, concern_text: str, analysis_type: str) -> str:
         """Prepare prompt for safety concern analysis"""
-        prompt = f"""Analyze the following safety concern and provide guidance:
-
-Concern Text: {concern_text}
-Analysis Type: {analysis_type}
-
-Please provide:
-1. Risk assessment and level
-2. Immediate safety recommendations
-3. Long-term safety measures
-4. When to seek professional help
-5. Resources and support options
-
-Focus on practical, actionable advice that prioritizes child safety."""
-
-        return prompt
+        return ANALYSIS_PROMPT_TEMPLATE.format(concern_text=concern_text, analysis_type=analysis_type)
     
     def _extract_response_content(self, response: ChatCompletion) -> Optional[str]:
         """Extract content from OpenAI API response"""
@@ -339,61 +726,42 @@ Focus on practical, actionable advice that prioritizes child safety."""
             logger.error(f"Error extracting response content: {e}")
             return None
     
+    def _fast_clean(self, text: str) -> str:
+        """clean_text, skipping strings it would return unchanged"""
+        # Already-clean: ASCII, single-spaced, trimmed, and free of the
+        # characters that trigger HTML stripping or entity decoding
+        if (
+            text.isascii()
+            and text == " ".join(text.split())
+            and "<" not in text and "&" not in text and ":" not in text
+        ):
+            return text
+        if len(text) <= CLEAN_TEXT_CACHE_MAX_LEN:
+            return _clean_text_cached(text)
+        return self.text_cleaner.clean_text(text)
+    
     def _clean_incident_data(self, incident_data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean and validate incident data"""
-        cleaned_data = {}
-        
-        for key, value in incident_data.items():
-            if isinstance(value, str):
-                cleaned_data[key] = self.text_cleaner.clean_text(value)
-            else:
-                cleaned_data[key] = value
-        
-        return cleaned_data
+        return {
+            key: self._fast_clean(value) if isinstance(value, str) else value
+            for key, value in incident_data.items()
+        }
     
     def _assess_risk_level(self, text: str) -> str:
         """Assess risk level based on text content"""
-        text_lower = text.lower()
-        
-        # High-risk keywords
-        high_risk_keywords = [
-            "immediate danger", "emergency", "hurt", "pain", "bleeding",
-            "unconscious", "choking", "poison", "fire", "weapon"
-        ]
-        
-        # Medium-risk keywords
-        medium_risk_keywords = [
-            "uncomfortable", "scared", "worried", "strange", "suspicious",
-            "bullying", "harassment", "inappropriate", "touch"
-        ]
-        
-        for keyword in high_risk_keywords:
-            if keyword in text_lower:
-                return "high"
-        
-        for keyword in medium_risk_keywords:
-            if keyword in text_lower:
-                return "medium"
-        
+        if HIGH_RISK_PATTERN.search(text):
+            return "high"
+        if MEDIUM_RISK_PATTERN.search(text):
+            return "medium"
         return "low"
     
     def _extract_recommendations(self, analysis: str) -> List[str]:
         """Extract recommendations from analysis text"""
-        recommendations = []
-        
-        # Simple extraction based on common patterns
-        lines = analysis.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith(('-', '•', '*', '1.', '2.', '3.')):
-                recommendations.append(line.lstrip('-•*1234567890. '))
-        
-        return recommendations[:5]  # Limit to 5 recommendations
+        # Limit to 5 recommendations; the scan stops once they are found
+        return [m.group(1) for m in islice(RECOMMENDATION_PATTERN.finditer(analysis), 5)]
     
     async def _get_fallback_response(self, message: str, response_type: str) -> Dict[str, Any]:
         """Get fallback response when GPT is unavailable"""
-        import random
-        
         responses = self.fallback_responses.get(response_type, self.fallback_responses["general"])
         fallback_response = random.choice(responses)
         
@@ -411,27 +779,12 @@ Focus on practical, actionable advice that prioritizes child safety."""
         template_type: str
     ) -> Dict[str, Any]:
         """Generate fallback complaint when GPT is unavailable"""
-        fallback_draft = f"""COMPLAINT DRAFT - {template_type.upper()}
-
-Date: {self.time_utils.get_current_timestamp()}
-Incident Type: {incident_data.get('incident_type', 'Child Safety Incident')}
-Priority: {incident_data.get('priority', 'Medium')}
-
-DESCRIPTION:
-{incident_data.get('description', 'Incident description not provided')}
-
-CHILD INFORMATION:
-Age: {incident_data.get('child_age', 'Unknown')}
-Gender: {incident_data.get('child_gender', 'Unknown')}
-
-GUARDIAN INFORMATION:
-Name: {incident_data.get('guardian_name', 'Unknown')}
-Contact: {incident_data.get('guardian_contact', 'Unknown')}
-
-REQUESTED ACTION:
-Please investigate this incident and take appropriate action to ensure child safety.
-
-Note: This is a fallback draft. For more detailed legal assistance, please consult with a legal professional."""
+        timestamp = self.time_utils.get_current_timestamp()
+        fields = _PromptFields(_FALLBACK_COMPLAINT_DEFAULTS)
+        fields.update(incident_data)
+        fields["template_type"] = template_type.upper()
+        fields["timestamp"] = timestamp
+        fallback_draft = FALLBACK_COMPLAINT_TEMPLATE.format_map(fields)
 
         return {
             "success": False,
@@ -439,7 +792,7 @@ Note: This is a fallback draft. For more detailed legal assistance, please consu
             "template_type": template_type,
             "fallback": True,
             "error": "GPT service unavailable, using fallback complaint",
-            "timestamp": self.time_utils.get_current_timestamp(),
+            "timestamp": timestamp,
             "metadata": {
                 "incident_type": incident_data.get("incident_type"),
                 "priority": incident_data.get("priority"),
@@ -485,8 +838,12 @@ Note: This is a fallback analysis. For specific safety concerns, please consult
             ]
         }
     
-    async def health_check(self) -> Dict[str, Any]:
-        """Check GPT service health"""
+    async def health_check(self, deep: bool = False) -> Dict[str, Any]:
+        """Check GPT service health
+        
+        The default probe lists models, which checks auth and connectivity
+        without spending tokens. deep=True runs a small chat completion instead.
+        """
         try:
             if not self.client:
                 return {
@@ -495,20 +852,32 @@ Note: This is a fallback analysis. For specific safety concerns, please consult
                     "timestamp": self.time_utils.get_current_timestamp()
                 }
             
-            # Test API connection with a simple request
-            response = await self.client.chat.completions.create(
-                model="gpt-3.5-turbo",  # Use cheaper model for health check
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=10,
-                timeout=10.0
-            )
+            if not deep and self._hc_cache is not None:
+                checked_at, cached = self._hc_cache
+                if time.monotonic() - checked_at < HEALTHCHECK_TTL:
+                    return cached
             
-            return {
+            if deep:
+                # Test API connection with a simple request
+                await self.client.with_options(timeout=10.0).chat.completions.create(
+                    model="gpt-3.5-turbo",  # Use cheaper model for health check
+                    messages=[{"role": "user", "content": "Hello"}],
+                    max_tokens=10
+                )
+            else:
+                response = await self.client.with_options(timeout=5.0).models.list()
+                if not response.data:
+                    raise RuntimeError("OpenAI returned no models")
+            
+            result = {
                 "status": "healthy",
                 "model": self.model,
                 "api_working": True,
                 "timestamp": self.time_utils.get_current_timestamp()
             }
+            if not deep:
+                self._hc_cache = (time.monotonic(), result)
+            return result
             
         except Exception as e:
             logger.error(f"GPT service health check failed: {e}")
@@ -518,13 +887,27 @@ Note: This is a fallback analysis. For specific safety concerns, please consult
                 "timestamp": self.time_utils.get_current_timestamp()
             }
     
+    async def aclose(self) -> None:
+        """Stop batch dispatch and release the shared HTTP connection pool"""
+        if self.batch_dispatcher is not None:
+            await self.batch_dispatcher.close()
+        await self.ai_manager.close()
+        await self._http.aclose()
+    
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get GPT service usage statistics"""
         return {
             "model": self.model,
+            "model_low": self.model_low,
+            "model_high": self.model_high,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "api_key_configured": bool(self.api_key),
             "client_available": bool(self.client),
-            "fallback_responses_available": bool(self.fallback_responses)
+            "fallback_responses_available": bool(self.fallback_responses),
+            "response_cache": self._chat_cache.stats(),
+            "analysis_cache": self._analysis_cache.stats()
         }
+
+# Shared instance so every API module uses the same connection pool
+gpt_service = GPTService()
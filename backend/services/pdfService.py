@@ -298,8 +298,8 @@ class PDFService:
             basic_info = [
                 ["Complaint ID:", getattr(complaint_data, 'complaint_id', 'N/A')],
                 ["Date Filed:", getattr(complaint_data, 'created_at', 'N/A')],
-                ["Status:", complaint_data.status.value if complaint_data.status else "N/A"],
-                ["Priority:", complaint_data.priority.value if complaint_data.priority else "N/A"]
+                ["Status:", complaint_data.status or "N/A"],
+                ["Priority:", complaint_data.priority or "N/A"]
             ]
             
             basic_table = Table(basic_info, colWidths=[2*inch, 4*inch])
@@ -474,8 +474,8 @@ class PDFService:
             basic_data = [
                 ["Complaint ID:", complaint_data.complaint_id or "N/A"],
                 ["Date Filed:", complaint_data.date_filed or "N/A"],
-                ["Status:", complaint_data.status.value if complaint_data.status else "N/A"],
-                ["Priority:", complaint_data.priority.value if complaint_data.priority else "N/A"]
+                ["Status:", complaint_data.status or "N/A"],
+                ["Priority:", complaint_data.priority or "N/A"]
             ]
             
             for i, (label, value) in enumerate(basic_data):
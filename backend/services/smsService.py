@@ -1,63 +1,266 @@
 import os
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import random
+import re
+import string
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
 import json
 
 # Twilio library
 try:
     from twilio.rest import Client
-    from twilio.base.exceptions import TwilioException
     TWILIO_AVAILABLE = True
 except ImportError:
     logger = logging.getLogger(__name__)
     TWILIO_AVAILABLE = False
     logger.warning("Twilio library not available. SMS service will be disabled.")
 
+# Async HTTP client for the Twilio REST API (keeps TLS sessions alive between alerts)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Redis backs the shared sliding-window rate limiter
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 from utils.textCleaner import TextCleaner
 from utils.timeUtils import TimeUtils
 
 logger = logging.getLogger(__name__)
 
+TWILIO_API_BASE_URL = "https://api.twilio.com/2010-04-01"
+
+@dataclass(frozen=True)
+class _SMSConfig:
+    """SMS settings read from the environment"""
+    account_sid: Optional[str]
+    auth_token: Optional[str]
+    phone_number: Optional[str]
+    max_message_length: int
+    default_country_code: str
+    retry_attempts: int
+    retry_delay: int
+    concurrency: int
+    max_sms_per_hour: int
+    max_sms_per_day: int
+    redis_url: Optional[str]
+    fallback_email: str
+    fallback_webhook: str
+
+@lru_cache(maxsize=1)
+def _load_config() -> _SMSConfig:
+    """Read SMS settings from the environment once per process"""
+    return _SMSConfig(
+        account_sid=os.getenv("TWILIO_ACCOUNT_SID"),
+        auth_token=os.getenv("TWILIO_AUTH_TOKEN"),
+        phone_number=os.getenv("TWILIO_PHONE_NUMBER"),
+        max_message_length=int(os.getenv("SMS_MAX_LENGTH", "160")),
+        default_country_code=os.getenv("SMS_DEFAULT_COUNTRY", "+1"),
+        retry_attempts=int(os.getenv("SMS_RETRY_ATTEMPTS", "3")),
+        retry_delay=int(os.getenv("SMS_RETRY_DELAY_SECONDS", "5")),
+        concurrency=int(os.getenv("SMS_CONCURRENCY", "8")),
+        max_sms_per_hour=int(os.getenv("SMS_MAX_PER_HOUR", "100")),
+        max_sms_per_day=int(os.getenv("SMS_MAX_PER_DAY", "1000")),
+        redis_url=os.getenv("REDIS_URL"),
+        fallback_email=os.getenv("SMS_FALLBACK_EMAIL", ""),
+        fallback_webhook=os.getenv("SMS_FALLBACK_WEBHOOK", "")
+    )
+
+NON_DIGIT_PATTERN = re.compile(r"\D+")
+
+# Twilio message creation has no idempotency key, so only retry when the message
+# cannot have been accepted: the request never left (connection-level errors) or
+# Twilio explicitly refused it (429, or 503 with Retry-After)
+if HTTPX_AVAILABLE:
+    NOT_SENT_ERRORS: Tuple[type, ...] = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+else:
+    NOT_SENT_ERRORS = ()
+MAX_RETRY_DELAY = 30.0
+
+RATE_LIMIT_HOUR_SECONDS = 3600
+RATE_LIMIT_DAY_SECONDS = 86400
+
+# Trim, count and reserve in one atomic step so concurrent
+# workers cannot both pass the check for the last remaining slots.
+# KEYS[1] = window key; ARGV = now, additional_sms, max_per_hour, max_per_day, member prefix
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local additional = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - 86400)
+local day_count = redis.call('ZCARD', key)
+local hour_count = redis.call('ZCOUNT', key, now - 3600, '+inf')
+if hour_count + additional > tonumber(ARGV[3]) or day_count + additional > tonumber(ARGV[4]) then
+    return 0
+end
+for i = 1, additional do
+    redis.call('ZADD', key, now, ARGV[5] .. ':' .. i)
+end
+redis.call('EXPIRE', key, 86400)
+return 1
+"""
+
+# Placeholder defaults for each kind of outgoing message
+EMERGENCY_MESSAGE_DEFAULTS = {
+    "child_name": "Child",
+    "location": "Unknown location",
+    "contact_number": "Unknown",
+    "priority": "High",
+    "description": "Safety concern",
+    "incident_type": "Incident",
+    "status": "Reported",
+    "update_type": "Update"
+}
+SAFETY_MESSAGE_DEFAULTS = {
+    "description": "Safety notification",
+    "location": "Unknown location",
+    "contact_number": "Unknown"
+}
+STATUS_MESSAGE_DEFAULTS = {
+    "update_type": "Status update",
+    "description": "No details provided",
+    "contact_number": "Unknown"
+}
+
+_FORMATTER = string.Formatter()
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_number(phone_number: str) -> Tuple[bool, str]:
+    """Validity (7-15 digits) and Twilio formatting for a phone number, from one digit scan"""
+    digits_only = NON_DIGIT_PATTERN.sub("", phone_number)
+    is_valid = 7 <= len(digits_only) <= 15
+    
+    # Add country code if not present
+    if phone_number.startswith('+'):
+        return is_valid, phone_number
+    if len(digits_only) == 10:  # US number
+        return is_valid, f"+1{digits_only}"
+    # US numbers with country code (11 digits starting with 1) and everything else
+    return is_valid, f"+{digits_only}"
+
+def _bulk_format_phone_numbers(phone_numbers: List[str]) -> List[Optional[str]]:
+    """Twilio-formatted number for each input, or None when invalid; repeats are resolved once"""
+    seen: Dict[str, Optional[str]] = {}
+    formatted: List[Optional[str]] = [None] * len(phone_numbers)
+    for i, phone_number in enumerate(phone_numbers):
+        if phone_number in seen:
+            formatted[i] = seen[phone_number]
+            continue
+        result = None
+        if phone_number:
+            is_valid, normalized = _normalize_phone_number(phone_number)
+            if is_valid:
+                result = normalized
+        seen[phone_number] = formatted[i] = result
+    return formatted
+
+def _compile_template(template: str, defaults: Dict[str, Any]) -> Callable[[Dict[str, Any]], str]:
+    """Compile a str.format template into an f-string function that reads fields from a dict"""
+    # Literals and defaults are passed as globals so the generated source needs no escaping
+    namespace: Dict[str, Any] = {}
+    pieces = []
+    for i, (literal, field, _, _) in enumerate(_FORMATTER.parse(template)):
+        if literal:
+            namespace[f"_lit{i}"] = literal
+            pieces.append(f"{{_lit{i}}}")
+        if field is not None:
+            if not field.isidentifier():
+                raise ValueError(f"Unsupported template field: {field!r}")
+            namespace[f"_default{i}"] = defaults[field]
+            pieces.append(f"{{data.get({field!r}, _default{i})}}")
+    exec(f'def render(data):\n    return f"{"".join(pieces)}"\n', namespace)
+    return namespace["render"]
+
 class SMSService:
     """Service for sending SMS notifications using Twilio"""
     
+    # One Twilio connection pool per process, shared by every SMSService instance
+    _shared_http: ClassVar[Optional["httpx.AsyncClient"]] = None
+    
     def __init__(self):
         self.text_cleaner = TextCleaner()
         self.time_utils = TimeUtils()
+        self.cfg = _load_config()
         
         # Twilio configuration
-        self.account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-        self.auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-        self.phone_number = os.getenv("TWILIO_PHONE_NUMBER")
+        self.account_sid = self.cfg.account_sid
+        self.auth_token = self.cfg.auth_token
+        self.phone_number = self.cfg.phone_number
+        self._twilio_configured = bool(self.account_sid and self.auth_token and self.phone_number)
         
         # SMS settings
-        self.max_message_length = int(os.getenv("SMS_MAX_LENGTH", "160"))
-        self.default_country_code = os.getenv("SMS_DEFAULT_COUNTRY", "+1")
-        self.retry_attempts = int(os.getenv("SMS_RETRY_ATTEMPTS", "3"))
-        self.retry_delay = int(os.getenv("SMS_RETRY_DELAY_SECONDS", "5"))
+        self.max_message_length = self.cfg.max_message_length
+        self.default_country_code = self.cfg.default_country_code
+        self.retry_attempts = self.cfg.retry_attempts
+        self.retry_delay = self.cfg.retry_delay
+        
+        # Bounds concurrent Twilio requests across all fan-out sends
+        self._send_sem = asyncio.Semaphore(self.cfg.concurrency)
         
         # Rate limiting
-        self.max_sms_per_hour = int(os.getenv("SMS_MAX_PER_HOUR", "100"))
-        self.max_sms_per_day = int(os.getenv("SMS_MAX_PER_DAY", "1000"))
+        self.max_sms_per_hour = self.cfg.max_sms_per_hour
+        self.max_sms_per_day = self.cfg.max_sms_per_day
         
         # Initialize Twilio client
         self.client = None
-        self.sms_sent_count = 0
-        self.sms_sent_today = 0
-        self.last_sms_reset = datetime.now()
         
-        if self._validate_twilio_config():
+        if self._twilio_configured:
             try:
                 self.client = Client(self.account_sid, self.auth_token)
                 logger.info("Twilio client initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize Twilio client: {e}")
+                logger.error("Failed to initialize Twilio client: %s", e)
                 self.client = None
         else:
             logger.warning("Twilio configuration incomplete. SMS service will use fallback methods.")
         
+        # Shared async HTTP client reused for every outbound Twilio request.
+        # Credentials come from the process-wide config, so one pool serves all instances.
+        self._http = None
+        if HTTPX_AVAILABLE and self._twilio_configured:
+            shared = SMSService._shared_http
+            if shared is None or shared.is_closed:
+                shared = SMSService._shared_http = httpx.AsyncClient(
+                    base_url=TWILIO_API_BASE_URL,
+                    auth=(self.account_sid, self.auth_token),
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                    timeout=10.0
+                )
+            self._http = shared
+        
+        # Sliding-window rate limiter: a Redis sorted set of send timestamps shared
+        # by every worker, or an in-process window when Redis is not configured
+        self.redis = None
+        self._rate_limit_script = None
+        self._rate_limit_key = f"sms:rate:{self.account_sid or 'default'}"
+        self._local_sends = deque()
+        if REDIS_AVAILABLE and self.cfg.redis_url:
+            self.redis = aioredis.Redis.from_url(self.cfg.redis_url)
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT
+            self._rate_limit_script = self.redis.register_script(SLIDING_WINDOW_SCRIPT)
+        else:
+            logger.warning("REDIS_URL not configured. SMS rate limits are enforced per process only.")
+        
         # Emergency contact templates
         self.emergency_templates = {
             "sos_alert": {
@@ -80,10 +283,38 @@ class SMSService:
         
         # Fallback SMS methods (when Twilio is unavailable)
         self.fallback_methods = {
-            "email": os.getenv("SMS_FALLBACK_EMAIL", ""),
-            "webhook": os.getenv("SMS_FALLBACK_WEBHOOK", ""),
+            "email": self.cfg.fallback_email,
+            "webhook": self.cfg.fallback_webhook,
             "log": True
         }
+        # Fallback settings never change after init, so the send path reads flags
+        self._fb_log = bool(self.fallback_methods.get("log"))
+        self._fb_email = bool(self.fallback_methods.get("email"))
+        self._fb_webhook = bool(self.fallback_methods.get("webhook"))
+        self._fb_methods_list = tuple(self.fallback_methods.keys())
+        
+        # batch_send_sms entry handlers by message type; anything else is "general"
+        self._batch_handlers = {
+            "emergency": self._prepare_batch_emergency,
+            "safety": self._prepare_batch_safety
+        }
+        
+        # Templates are parsed once here; sends only call the compiled renderers.
+        # A template/defaults pair with a field that has no default is left out,
+        # matching the KeyError str.format would have raised.
+        self._compiled_templates: Dict[str, Dict[str, Callable[[Dict[str, Any]], str]]] = {}
+        for kind, defaults in (
+            ("emergency", EMERGENCY_MESSAGE_DEFAULTS),
+            ("safety", SAFETY_MESSAGE_DEFAULTS),
+            ("status", STATUS_MESSAGE_DEFAULTS)
+        ):
+            renderers = {}
+            for name, template_info in self.emergency_templates.items():
+                try:
+                    renderers[name] = _compile_template(template_info["template"], defaults)
+                except KeyError:
+                    continue
+            self._compiled_templates[kind] = renderers
     
     async def send_emergency_alert(
         self, 
@@ -108,8 +339,12 @@ class SMSService:
                     "sent_count": 0
                 }
             
+            # One clock read covers the rate check and every result timestamp
+            now = time.time()
+            timestamp = self._format_timestamp(now)
+            
             # Check rate limits
-            if not self._check_rate_limits(len(recipients)):
+            if not await self._check_rate_limits(len(recipients), now):
                 return {
                     "success": False,
                     "error": "Rate limit exceeded",
@@ -117,7 +352,7 @@ class SMSService:
                 }
             
             # Prepare message
-            message = self._prepare_emergency_message(alert_data, alert_type)
+            message = self._finalize_message(self._prepare_emergency_message(alert_data, alert_type))
             if not message:
                 return {
                     "success": False,
@@ -126,32 +361,12 @@ class SMSService:
                 }
             
             # Send SMS to all recipients
-            results = []
-            for recipient in recipients:
-                result = await self._send_single_sms(recipient, message, alert_type)
-                results.append(result)
-                
-                # Small delay between sends to avoid overwhelming the service
-                await asyncio.sleep(0.5)
+            results = await self._send_to_recipients(recipients, message, alert_type, timestamp)
             
-            # Count successful sends
-            successful_sends = sum(1 for r in results if r["success"])
-            
-            # Update counters
-            self.sms_sent_count += successful_sends
-            self.sms_sent_today += successful_sends
-            
-            return {
-                "success": successful_sends > 0,
-                "sent_count": successful_sends,
-                "total_recipients": len(recipients),
-                "failed_count": len(recipients) - successful_sends,
-                "results": results,
-                "timestamp": self.time_utils.get_current_timestamp()
-            }
+            return self._summarize_sends(results, timestamp)
             
         except Exception as e:
-            logger.error(f"Error sending emergency alert: {e}")
+            logger.error("Error sending emergency alert: %s", e)
             return {
                 "success": False,
                 "error": f"Emergency alert failed: {str(e)}",
@@ -173,8 +388,10 @@ class SMSService:
                     "sent_count": 0
                 }
             
+            timestamp = self._format_timestamp(time.time())
+            
             # Prepare message
-            message = self._prepare_safety_message(notification_data, notification_type)
+            message = self._finalize_message(self._prepare_safety_message(notification_data, notification_type))
             if not message:
                 return {
                     "success": False,
@@ -183,29 +400,15 @@ class SMSService:
                 }
             
             # Send notifications
-            results = []
-            for recipient in recipients:
-                result = await self._send_single_sms(recipient, message, notification_type)
-                results.append(result)
-                await asyncio.sleep(0.3)
+            results = await self._send_to_recipients(recipients, message, notification_type, timestamp)
             
-            successful_sends = sum(1 for r in results if r["success"])
-            
-            # Update counters
-            self.sms_sent_count += successful_sends
-            self.sms_sent_today += successful_sends
-            
-            return {
-                "success": successful_sends > 0,
-                "sent_count": successful_sends,
-                "total_recipients": len(recipients),
-                "failed_count": len(recipients) - successful_sends,
-                "results": results,
-                "timestamp": self.time_utils.get_current_timestamp()
-            }
+            # Safety notifications are never refused, but count toward the limits
+            summary = self._summarize_sends(results, timestamp)
+            await self._record_sends(summary["sent_count"])
+            return summary
             
         except Exception as e:
-            logger.error(f"Error sending safety notification: {e}")
+            logger.error("Error sending safety notification: %s", e)
             return {
                 "success": False,
                 "error": f"Safety notification failed: {str(e)}",
@@ -226,8 +429,10 @@ class SMSService:
                     "sent_count": 0
                 }
             
+            timestamp = self._format_timestamp(time.time())
+            
             # Prepare message
-            message = self._prepare_status_message(update_data)
+            message = self._finalize_message(self._prepare_status_message(update_data))
             if not message:
                 return {
                     "success": False,
@@ -236,29 +441,15 @@ class SMSService:
                 }
             
             # Send updates
-            results = []
-            for recipient in recipients:
-                result = await self._send_single_sms(recipient, message, "status_update")
-                results.append(result)
-                await asyncio.sleep(0.2)
-            
-            successful_sends = sum(1 for r in results if r["success"])
+            results = await self._send_to_recipients(recipients, message, "status_update", timestamp)
             
-            # Update counters
-            self.sms_sent_count += successful_sends
-            self.sms_sent_today += successful_sends
-            
-            return {
-                "success": successful_sends > 0,
-                "sent_count": successful_sends,
-                "total_recipients": len(recipients),
-                "failed_count": len(recipients) - successful_sends,
-                "results": results,
-                "timestamp": self.time_utils.get_current_timestamp()
-            }
+            # Status updates are never refused, but count toward the limits
+            summary = self._summarize_sends(results, timestamp)
+            await self._record_sends(summary["sent_count"])
+            return summary
             
         except Exception as e:
-            logger.error(f"Error sending status update: {e}")
+            logger.error("Error sending status update: %s", e)
             return {
                 "success": False,
                 "error": f"Status update failed: {str(e)}",
@@ -278,46 +469,41 @@ class SMSService:
                     "results": []
                 }
             
-            # Check rate limits
-            total_recipients = sum(len(msg.get("recipients", [])) for msg in messages)
-            if not self._check_rate_limits(total_recipients):
+            # Render each message once and flatten every recipient into one send list
+            plans = []
+            sends = []
+            render_cache: Dict[Any, Optional[str]] = {}
+            for message_data in messages:
+                msg_type = message_data.get("type", "general")
+                handler = self._batch_handlers.get(msg_type, self._prepare_batch_general)
+                recipients, message, send_type, error = handler(message_data, render_cache)
+                plans.append((msg_type, len(sends), len(recipients), error))
+                if not error:
+                    sends.extend((recipient, message, send_type) for recipient in recipients)
+            
+            # One rate-limit check and one clock read cover the whole batch
+            now = time.time()
+            timestamp = self._format_timestamp(now)
+            if sends and not await self._check_rate_limits(len(sends), now):
                 return {
                     "success": False,
                     "error": "Rate limit exceeded for batch send",
                     "results": []
                 }
             
+            send_results = await self._send_many(sends, timestamp)
+            
             results = []
-            for i, message_data in enumerate(messages):
-                msg_type = message_data.get("type", "general")
-                recipients = message_data.get("recipients", [])
-                content = message_data.get("content", "")
-                
-                if msg_type == "emergency":
-                    result = await self.send_emergency_alert(
-                        message_data.get("alert_data", {}),
-                        recipients,
-                        message_data.get("alert_type", "sos_alert")
-                    )
-                elif msg_type == "safety":
-                    result = await self.send_safety_notification(
-                        message_data.get("notification_data", {}),
-                        recipients,
-                        message_data.get("notification_type", "safety_concern")
-                    )
+            for i, (msg_type, offset, count, error) in enumerate(plans):
+                if error:
+                    result = {"success": False, "error": error, "sent_count": 0}
+                elif msg_type in self._batch_handlers:
+                    result = self._summarize_sends(send_results[offset:offset + count], timestamp)
                 else:
-                    result = await self._send_single_sms(
-                        recipients[0] if recipients else "",
-                        content,
-                        "general"
-                    )
-                
+                    result = dict(send_results[offset])
                 result["message_index"] = i
                 result["message_type"] = msg_type
                 results.append(result)
-                
-                # Delay between batch messages
-                await asyncio.sleep(0.5)
             
             success_count = sum(1 for r in results if r["success"])
             
@@ -327,27 +513,151 @@ class SMSService:
                 "successful_sends": success_count,
                 "failed_sends": len(messages) - success_count,
                 "results": results,
-                "timestamp": self.time_utils.get_current_timestamp()
+                "timestamp": timestamp
             }
             
         except Exception as e:
-            logger.error(f"Error in batch SMS send: {e}")
+            logger.error("Error in batch SMS send: %s", e)
             return {
                 "success": False,
                 "error": f"Batch send failed: {str(e)}",
                 "results": []
             }
     
+    def _render_for_batch(
+        self, 
+        render_cache: Dict[Any, Optional[str]], 
+        prepare: Callable[[Dict[str, Any], str], Optional[str]], 
+        data: Dict[str, Any], 
+        template_name: str
+    ) -> Optional[str]:
+        """Finalized message for a batch entry, reusing identical renders within the batch"""
+        try:
+            key = (prepare.__name__, template_name, frozenset(data.items()))
+        except TypeError:  # unhashable field values are rendered uncached
+            return self._finalize_message(prepare(data, template_name))
+        if key not in render_cache:
+            render_cache[key] = self._finalize_message(prepare(data, template_name))
+        return render_cache[key]
+    
+    def _prepare_batch_emergency(
+        self, 
+        message_data: Dict[str, Any], 
+        render_cache: Dict[Any, Optional[str]]
+    ) -> Tuple[List[str], Optional[str], str, Optional[str]]:
+        """Recipients, message, send type and error for an emergency batch entry"""
+        recipients = message_data.get("recipients", [])
+        alert_data = message_data.get("alert_data", {})
+        alert_type = message_data.get("alert_type", "sos_alert")
+        if not recipients:
+            return recipients, None, alert_type, "No recipients specified"
+        if not self._validate_alert_data(alert_data):
+            return recipients, None, alert_type, "Invalid alert data"
+        message = self._render_for_batch(render_cache, self._prepare_emergency_message, alert_data, alert_type)
+        if not message:
+            return recipients, None, alert_type, "Failed to prepare emergency message"
+        return recipients, message, alert_type, None
+    
+    def _prepare_batch_safety(
+        self, 
+        message_data: Dict[str, Any], 
+        render_cache: Dict[Any, Optional[str]]
+    ) -> Tuple[List[str], Optional[str], str, Optional[str]]:
+        """Recipients, message, send type and error for a safety batch entry"""
+        recipients = message_data.get("recipients", [])
+        notification_type = message_data.get("notification_type", "safety_concern")
+        if not recipients:
+            return recipients, None, notification_type, "No recipients specified"
+        message = self._render_for_batch(
+            render_cache, self._prepare_safety_message, message_data.get("notification_data", {}), notification_type
+        )
+        if not message:
+            return recipients, None, notification_type, "Failed to prepare safety message"
+        return recipients, message, notification_type, None
+    
+    def _prepare_batch_general(
+        self, 
+        message_data: Dict[str, Any], 
+        render_cache: Dict[Any, Optional[str]]
+    ) -> Tuple[List[str], Optional[str], str, Optional[str]]:
+        """General batch entries go to the first recipient only"""
+        recipients = message_data.get("recipients", [])[:1] or [""]
+        message = self._finalize_message(message_data.get("content", ""))
+        if not message:
+            return recipients, None, "general", "Empty or invalid message content"
+        return recipients, message, "general", None
+    
+    def _summarize_sends(self, results: List[Dict[str, Any]], timestamp: str) -> Dict[str, Any]:
+        """Aggregate per-recipient send results"""
+        successful_sends = sum(1 for r in results if r["success"])
+        return {
+            "success": successful_sends > 0,
+            "sent_count": successful_sends,
+            "total_recipients": len(results),
+            "failed_count": len(results) - successful_sends,
+            "results": results,
+            "timestamp": timestamp
+        }
+    
+    def _format_timestamp(self, now: float) -> str:
+        """Format a time.time() value like TimeUtils.get_current_timestamp()"""
+        return datetime.fromtimestamp(now, timezone.utc).strftime(self.time_utils.time_formats["iso"])
+    
+    def _finalize_message(self, message: Optional[str]) -> str:
+        """Clean a message and truncate it to the SMS length limit"""
+        cleaned_message = self.text_cleaner.clean_text(message) if message else ""
+        if len(cleaned_message) > self.max_message_length:
+            cleaned_message = cleaned_message[:self.max_message_length-3] + "..."
+        return cleaned_message
+    
+    async def _send_to_recipients(
+        self, 
+        recipients: List[str], 
+        message: str, 
+        message_type: str,
+        timestamp: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Send one message to every recipient with bounded concurrency"""
+        return await self._send_many([(recipient, message, message_type) for recipient in recipients], timestamp)
+    
+    async def _send_many(self, sends: List[Tuple[str, str, str]], timestamp: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Send (recipient, message, type) tuples concurrently under the shared semaphore;
+        messages must already be finalized"""
+        # Validate and format every recipient in one pass before fanning out
+        formatted = _bulk_format_phone_numbers([recipient for recipient, _, _ in sends])
+        
+        async def send_one(recipient: str, formatted_recipient: Optional[str], message: str, message_type: str) -> Dict[str, Any]:
+            if formatted_recipient is None:
+                return {
+                    "success": False,
+                    "error": f"Invalid phone number: {recipient}",
+                    "recipient": recipient
+                }
+            async with self._send_sem:
+                return await self._send_single_sms(
+                    recipient, message, message_type,
+                    trusted=True, timestamp=timestamp, formatted_recipient=formatted_recipient
+                )
+        
+        return list(await asyncio.gather(*(
+            send_one(recipient, formatted_recipient, message, message_type)
+            for (recipient, message, message_type), formatted_recipient in zip(sends, formatted)
+        )))
+    
     async def _send_single_sms(
         self, 
         recipient: str, 
         message: str, 
-        message_type: str = "general"
+        message_type: str = "general",
+        trusted: bool = False,
+        timestamp: Optional[str] = None,
+        formatted_recipient: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send a single SMS message"""
+        """Send a single SMS message; trusted messages were already cleaned and truncated,
+        and a formatted_recipient means the number was already validated"""
         try:
             # Validate recipient
-            if not self._validate_phone_number(recipient):
+            if formatted_recipient is None and not self._validate_phone_number(recipient):
                 return {
                     "success": False,
                     "error": f"Invalid phone number: {recipient}",
@@ -355,7 +665,7 @@ class SMSService:
                 }
             
             # Clean and validate message
-            cleaned_message = self.text_cleaner.clean_text(message)
+            cleaned_message = message if trusted else self._finalize_message(message)
             if not cleaned_message:
                 return {
                     "success": False,
@@ -363,54 +673,90 @@ class SMSService:
                     "recipient": recipient
                 }
             
-            # Truncate message if too long
-            if len(cleaned_message) > self.max_message_length:
-                cleaned_message = cleaned_message[:self.max_message_length-3] + "..."
-            
             # Try Twilio first
-            if self.client and self._validate_twilio_config():
+            if self._http is not None and self._twilio_configured:
                 try:
-                    twilio_result = await self._send_via_twilio(recipient, cleaned_message)
+                    twilio_result = await self._send_via_twilio(recipient, cleaned_message, timestamp, formatted_recipient)
                     if twilio_result["success"]:
                         return twilio_result
                 except Exception as e:
-                    logger.warning(f"Twilio send failed, trying fallback: {e}")
+                    logger.warning("Twilio send failed, trying fallback: %s", e)
             
             # Use fallback methods
-            return await self._send_via_fallback(recipient, cleaned_message, message_type)
+            return await self._send_via_fallback(recipient, cleaned_message, message_type, timestamp)
             
         except Exception as e:
-            logger.error(f"Error sending single SMS: {e}")
+            logger.error("Error sending single SMS: %s", e)
             return {
                 "success": False,
                 "error": f"SMS send failed: {str(e)}",
                 "recipient": recipient
             }
     
-    async def _send_via_twilio(self, recipient: str, message: str) -> Dict[str, Any]:
-        """Send SMS via Twilio API"""
+    async def _send_via_twilio(
+        self, 
+        recipient: str, 
+        message: str, 
+        timestamp: Optional[str] = None,
+        formatted_recipient: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send SMS via Twilio REST API, retrying with backoff only when the message was not sent"""
         try:
             # Format recipient number
-            formatted_recipient = self._format_phone_number(recipient)
+            if formatted_recipient is None:
+                formatted_recipient = self._format_phone_number(recipient)
+            attempts = max(1, self.retry_attempts)
+            
+            for attempt in range(attempts):
+                try:
+                    # Send message over the shared keep-alive client
+                    response = await self._http.post(
+                        f"/Accounts/{self.account_sid}/Messages.json",
+                        data={
+                            "To": formatted_recipient,
+                            "From": self.phone_number,
+                            "Body": message
+                        }
+                    )
+                except NOT_SENT_ERRORS as e:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = self._retry_delay(attempt)
+                    logger.warning("Twilio request failed (%s); retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                
+                retry_after = response.headers.get("retry-after")
+                refused = response.status_code == 429 or (response.status_code == 503 and retry_after)
+                if refused and attempt < attempts - 1:
+                    delay = self._retry_delay(attempt, retry_after)
+                    logger.warning("Twilio API returned %s; retrying in %.1fs", response.status_code, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                break
             
-            # Send message
-            message_obj = self.client.messages.create(
-                body=message,
-                from_=self.phone_number,
-                to=formatted_recipient
-            )
+            if response.status_code >= 400:
+                logger.error("Twilio API error: %s %s", response.status_code, response.text)
+                return {
+                    "success": False,
+                    "error": f"Twilio API error: {response.status_code}",
+                    "recipient": recipient,
+                    "provider": "twilio"
+                }
+            
+            message_obj = response.json()
             
             return {
                 "success": True,
-                "message_sid": message_obj.sid,
-                "status": message_obj.status,
+                "message_sid": message_obj.get("sid"),
+                "status": message_obj.get("status"),
                 "recipient": recipient,
                 "provider": "twilio",
-                "timestamp": self.time_utils.get_current_timestamp()
+                "timestamp": timestamp or self.time_utils.get_current_timestamp()
             }
             
-        except TwilioException as e:
-            logger.error(f"Twilio API error: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Twilio API error: %s", e)
             return {
                 "success": False,
                 "error": f"Twilio API error: {str(e)}",
@@ -418,7 +764,7 @@ class SMSService:
                 "provider": "twilio"
             }
         except Exception as e:
-            logger.error(f"Unexpected error in Twilio send: {e}")
+            logger.error("Unexpected error in Twilio send: %s", e)
             return {
                 "success": False,
                 "error": f"Twilio send error: {str(e)}",
@@ -426,29 +772,39 @@ class SMSService:
                 "provider": "twilio"
             }
     
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter, overridden by a Retry-After header"""
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, float(retry_after))
+            except ValueError:
+                pass
+        return min(MAX_RETRY_DELAY, self.retry_delay * (2 ** attempt) * (1 + random.random() * 0.5))
+    
     async def _send_via_fallback(
         self, 
         recipient: str, 
         message: str, 
-        message_type: str
+        message_type: str,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send SMS via fallback methods"""
         try:
             fallback_results = []
             
             # Log the message
-            if self.fallback_methods.get("log"):
-                logger.info(f"FALLBACK SMS - To: {recipient}, Type: {message_type}, Message: {message[:50]}...")
+            if self._fb_log:
+                logger.info("FALLBACK SMS - To: %s, Type: %s, Message: %.50s...", recipient, message_type, message)
                 fallback_results.append("log")
             
             # Send via email if configured
-            if self.fallback_methods.get("email"):
+            if self._fb_email:
                 email_result = await self._send_via_email(recipient, message, message_type)
                 if email_result["success"]:
                     fallback_results.append("email")
             
             # Send via webhook if configured
-            if self.fallback_methods.get("webhook"):
+            if self._fb_webhook:
                 webhook_result = await self._send_via_webhook(recipient, message, message_type)
                 if webhook_result["success"]:
                     fallback_results.append("webhook")
@@ -459,7 +815,7 @@ class SMSService:
                     "fallback_methods": fallback_results,
                     "recipient": recipient,
                     "provider": "fallback",
-                    "timestamp": self.time_utils.get_current_timestamp()
+                    "timestamp": timestamp or self.time_utils.get_current_timestamp()
                 }
             else:
                 return {
@@ -470,7 +826,7 @@ class SMSService:
                 }
                 
         except Exception as e:
-            logger.error(f"Error in fallback SMS send: {e}")
+            logger.error("Error in fallback SMS send: %s", e)
             return {
                 "success": False,
                 "error": f"Fallback send failed: {str(e)}",
@@ -500,11 +856,7 @@ class SMSService:
     
     def _validate_twilio_config(self) -> bool:
         """Validate Twilio configuration"""
-        return all([
-            self.account_sid,
-            self.auth_token,
-            self.phone_number
-        ])
+        return self._twilio_configured
     
     def _validate_alert_data(self, alert_data: Dict[str, Any]) -> bool:
         """Validate emergency alert data"""
@@ -516,27 +868,11 @@ class SMSService:
         if not phone_number:
             return False
         
-        # Remove all non-digit characters
-        digits_only = ''.join(filter(str.isdigit, phone_number))
-        
-        # Check if it's a reasonable length (7-15 digits)
-        return 7 <= len(digits_only) <= 15
+        return _normalize_phone_number(phone_number)[0]
     
     def _format_phone_number(self, phone_number: str) -> str:
         """Format phone number for Twilio"""
-        # Remove all non-digit characters
-        digits_only = ''.join(filter(str.isdigit, phone_number))
-        
-        # Add country code if not present
-        if not phone_number.startswith('+'):
-            if len(digits_only) == 10:  # US number
-                return f"+1{digits_only}"
-            elif len(digits_only) == 11 and digits_only.startswith('1'):  # US number with country code
-                return f"+{digits_only}"
-            else:
-                return f"+{digits_only}"
-        
-        return phone_number
+        return _normalize_phone_number(phone_number)[1]
     
     def _prepare_emergency_message(
         self, 
@@ -545,28 +881,14 @@ class SMSService:
     ) -> Optional[str]:
         """Prepare emergency message from template"""
         try:
-            template_info = self.emergency_templates.get(alert_type)
-            if not template_info:
+            render = self._compiled_templates["emergency"].get(alert_type)
+            if not render:
                 return None
             
-            template = template_info["template"]
-            
-            # Fill template with alert data
-            message = template.format(
-                child_name=alert_data.get("child_name", "Child"),
-                location=alert_data.get("location", "Unknown location"),
-                contact_number=alert_data.get("contact_number", "Unknown"),
-                priority=alert_data.get("priority", "High"),
-                description=alert_data.get("description", "Safety concern"),
-                incident_type=alert_data.get("incident_type", "Incident"),
-                status=alert_data.get("status", "Reported"),
-                update_type=alert_data.get("update_type", "Update")
-            )
-            
-            return message
+            return render(alert_data)
             
         except Exception as e:
-            logger.error(f"Error preparing emergency message: {e}")
+            logger.error("Error preparing emergency message: %s", e)
             return None
     
     def _prepare_safety_message(
@@ -576,89 +898,127 @@ class SMSService:
     ) -> Optional[str]:
         """Prepare safety notification message"""
         try:
-            template_info = self.emergency_templates.get(notification_type)
-            if not template_info:
+            render = self._compiled_templates["safety"].get(notification_type)
+            if not render:
                 return None
             
-            template = template_info["template"]
-            
-            message = template.format(
-                description=notification_data.get("description", "Safety notification"),
-                location=notification_data.get("location", "Unknown location"),
-                contact_number=notification_data.get("contact_number", "Unknown")
-            )
-            
-            return message
+            return render(notification_data)
             
         except Exception as e:
-            logger.error(f"Error preparing safety message: {e}")
+            logger.error("Error preparing safety message: %s", e)
             return None
     
     def _prepare_status_message(self, update_data: Dict[str, Any]) -> Optional[str]:
         """Prepare status update message"""
         try:
-            template_info = self.emergency_templates.get("status_update")
-            if not template_info:
+            render = self._compiled_templates["status"].get("status_update")
+            if not render:
                 return None
             
-            template = template_info["template"]
-            
-            message = template.format(
-                update_type=update_data.get("update_type", "Status update"),
-                description=update_data.get("description", "No details provided"),
-                contact_number=update_data.get("contact_number", "Unknown")
-            )
-            
-            return message
+            return render(update_data)
             
         except Exception as e:
-            logger.error(f"Error preparing status message: {e}")
+            logger.error("Error preparing status message: %s", e)
             return None
     
-    def _check_rate_limits(self, additional_sms: int) -> bool:
-        """Check if sending additional SMS would exceed rate limits"""
+    async def _check_rate_limits(self, additional_sms: int, now: Optional[float] = None) -> bool:
+        """Check the rolling hour/day windows and reserve slots for additional SMS"""
         try:
-            current_time = datetime.now()
+            if now is None:
+                now = time.time()
             
-            # Reset daily counter if it's a new day
-            if current_time.date() > self.last_sms_reset.date():
-                self.sms_sent_today = 0
-                self.last_sms_reset = current_time
+            if self._rate_limit_script is not None:
+                allowed = await self._rate_limit_script(
+                    keys=[self._rate_limit_key],
+                    args=[
+                        now,
+                        additional_sms,
+                        self.max_sms_per_hour,
+                        self.max_sms_per_day,
+                        uuid.uuid4().hex
+                    ]
+                )
+                return bool(allowed)
             
-            # Check hourly limit
-            if self.sms_sent_count >= self.max_sms_per_hour:
-                return False
+            # In-process window: timestamps are appended in order, so trim from the left
+            sends = self._local_sends
+            while sends and sends[0] <= now - RATE_LIMIT_DAY_SECONDS:
+                sends.popleft()
+            hour_start = now - RATE_LIMIT_HOUR_SECONDS
+            hour_count = sum(1 for sent_at in sends if sent_at > hour_start)
             
-            # Check daily limit
-            if self.sms_sent_today + additional_sms > self.max_sms_per_day:
+            if hour_count + additional_sms > self.max_sms_per_hour:
+                return False
+            if len(sends) + additional_sms > self.max_sms_per_day:
                 return False
             
+            sends.extend([now] * additional_sms)
             return True
             
         except Exception as e:
-            logger.error(f"Error checking rate limits: {e}")
+            logger.error("Error checking rate limits: %s", e)
             return False  # Fail safe - don't send if we can't check limits
     
+    async def _record_sends(self, count: int):
+        """Add sends to the rolling windows without checking the limits"""
+        if count <= 0:
+            return
+        try:
+            now = time.time()
+            if self.redis is not None:
+                batch_id = uuid.uuid4().hex
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.zadd(self._rate_limit_key, {f"{batch_id}:{i}": now for i in range(1, count + 1)})
+                    pipe.expire(self._rate_limit_key, RATE_LIMIT_DAY_SECONDS)
+                    await pipe.execute()
+            else:
+                self._local_sends.extend([now] * count)
+        except Exception as e:
+            logger.error("Error recording sends in rate limit window: %s", e)
+    
+    async def _get_window_counts(self) -> Dict[str, int]:
+        """Count SMS sent in the current rolling hour and day windows"""
+        now = time.time()
+        if self.redis is not None:
+            day_count = await self.redis.zcount(self._rate_limit_key, now - RATE_LIMIT_DAY_SECONDS, "+inf")
+            hour_count = await self.redis.zcount(self._rate_limit_key, now - RATE_LIMIT_HOUR_SECONDS, "+inf")
+        else:
+            day_start = now - RATE_LIMIT_DAY_SECONDS
+            hour_start = now - RATE_LIMIT_HOUR_SECONDS
+            day_count = sum(1 for sent_at in self._local_sends if sent_at > day_start)
+            hour_count = sum(1 for sent_at in self._local_sends if sent_at > hour_start)
+        return {"hour": hour_count, "day": day_count}
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check SMS service health"""
         try:
             twilio_status = "unavailable"
-            if self.client and self._validate_twilio_config():
+            if self._http is not None and self._twilio_configured:
+                try:
+                    # Test Twilio connection without blocking the event loop
+                    response = await self._http.get(f"/Accounts/{self.account_sid}.json")
+                    twilio_status = "healthy" if response.status_code < 400 else "unhealthy"
+                except Exception:
+                    twilio_status = "unhealthy"
+            elif self.client and self._twilio_configured:
                 try:
-                    # Test Twilio connection
-                    account = self.client.api.accounts(self.account_sid).fetch()
+                    # The SDK client is synchronous, so run it off the event loop
+                    await asyncio.to_thread(self.client.api.accounts(self.account_sid).fetch)
                     twilio_status = "healthy"
                 except Exception:
                     twilio_status = "unhealthy"
             
+            sent = await self._get_window_counts()
+            
             return {
                 "status": "healthy" if twilio_status == "healthy" or self.fallback_methods else "unhealthy",
                 "service": "SMS Service",
                 "twilio_status": twilio_status,
-                "fallback_methods": list(self.fallback_methods.keys()),
+                "fallback_methods": self._fb_methods_list,
                 "rate_limits": {
-                    "sms_sent_hour": self.sms_sent_count,
-                    "sms_sent_today": self.sms_sent_today,
+                    "backend": "redis" if self.redis is not None else "memory",
+                    "sms_sent_hour": sent["hour"],
+                    "sms_sent_today": sent["day"],
                     "max_per_hour": self.max_sms_per_hour,
                     "max_per_day": self.max_sms_per_day
                 },
@@ -666,7 +1026,7 @@ class SMSService:
             }
             
         except Exception as e:
-            logger.error(f"SMS service health check failed: {e}")
+            logger.error("SMS service health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "service": "SMS Service",
@@ -677,7 +1037,7 @@ class SMSService:
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get SMS service usage statistics"""
         return {
-            "twilio_configured": self._validate_twilio_config(),
+            "twilio_configured": self._twilio_configured,
             "fallback_methods": self.fallback_methods,
             "max_message_length": self.max_message_length,
             "default_country_code": self.default_country_code,
@@ -685,13 +1045,24 @@ class SMSService:
             "retry_delay": self.retry_delay,
             "max_sms_per_hour": self.max_sms_per_hour,
             "max_sms_per_day": self.max_sms_per_day,
-            "sms_sent_count": self.sms_sent_count,
-            "sms_sent_today": self.sms_sent_today
+            "rate_limit_backend": "redis" if self.redis is not None else "memory"
         }
     
-    def reset_counters(self):
-        """Reset SMS counters (useful for testing)"""
-        self.sms_sent_count = 0
-        self.sms_sent_today = 0
-        self.last_sms_reset = datetime.now()
+    async def aclose(self):
+        """Close the shared HTTP client (call on application shutdown)"""
+        if self._http is not None:
+            await self._http.aclose()
+            if SMSService._shared_http is self._http:
+                SMSService._shared_http = None
+            self._http = None
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+            self._rate_limit_script = None
+    
+    async def reset_counters(self):
+        """Reset SMS rate-limit windows (useful for testing)"""
+        self._local_sends.clear()
+        if self.redis is not None:
+            await self.redis.delete(self._rate_limit_key)
         logger.info("SMS counters reset")
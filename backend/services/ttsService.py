@@ -1,19 +1,147 @@
 import os
 import io
+import re
+import hashlib
 import logging
 import asyncio
-from typing import Dict, Any, Optional, BinaryIO
+import threading
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, BinaryIO, Tuple, Union
+import requests
 from gtts import gTTS
+from gtts import tts as gtts_tts
 from gtts.lang import tts_langs
-import tempfile
 import uuid
 from pathlib import Path
 
+# Async file I/O for cached clips (falls back to reads on a worker thread)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
 from utils.textCleaner import TextCleaner
 from utils.timeUtils import TimeUtils
 
 logger = logging.getLogger(__name__)
 
+# gTTS is synchronous (requests-based), so conversions run on a bounded thread pool
+TTS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TTS_WORKERS", "8")),
+    thread_name_prefix="tts"
+)
+
+class _SharedSession(requests.Session):
+    """requests.Session that stays open when gTTS uses it as a context manager"""
+    
+    def __exit__(self, *args):
+        pass
+
+# requests.Session is not thread-safe, so each TTS worker thread keeps its own
+# keep-alive session and TLS/TCP setup happens once per thread and host
+_gtts_sessions = threading.local()
+
+def _thread_gtts_session() -> requests.Session:
+    """Keep-alive session owned by the calling thread"""
+    session = getattr(_gtts_sessions, "session", None)
+    if session is None:
+        session = _gtts_sessions.session = _SharedSession()
+    return session
+
+# gTTS opens `with requests.Session()` per request; give its module a requests
+# namespace whose Session() returns the thread's session, leaving global requests untouched
+# (a re-import of this module finds its own shim already in place)
+_gtts_module_requests = getattr(gtts_tts, "requests", None)
+if (getattr(_gtts_module_requests, "Session", None) is requests.Session
+        or getattr(_gtts_module_requests, "_per_thread_sessions", False)):
+    _gtts_requests = types.ModuleType("requests")
+    _gtts_requests.__dict__.update(requests.__dict__)
+    _gtts_requests.Session = _thread_gtts_session
+    _gtts_requests._per_thread_sessions = True
+    gtts_tts.requests = _gtts_requests
+else:
+    logger.warning("gtts.tts no longer uses requests.Session; gTTS calls will not reuse connections")
+
+class _TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds, bursting up to `rate`"""
+    
+    def __init__(self, rate: int, period: float):
+        self.capacity = float(rate)
+        self._fill_rate = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+@lru_cache(maxsize=1)
+def _load_tts_langs() -> Dict[str, str]:
+    """Supported gTTS languages, loaded once per process"""
+    try:
+        return dict(tts_langs())
+    except Exception as e:
+        logger.warning(f"Could not get TTS languages: {e}")
+        # Fallback to common languages
+        return {
+            "en": "English",
+            "es": "Spanish",
+            "fr": "French",
+            "de": "German",
+            "it": "Italian",
+            "pt": "Portuguese",
+            "ru": "Russian",
+            "ja": "Japanese",
+            "ko": "Korean",
+            "zh": "Chinese"
+        }
+
+SUPPORTED_LANGUAGE_CODES = frozenset(_load_tts_langs())
+
+# The running cache-size counter is corrected by a full directory scan this often
+CACHE_RESCAN_INTERVAL_SECONDS = 3600
+
+# Minimum gap between background cache cleanups
+CACHE_CLEANUP_INTERVAL_SECONDS = 300
+
+# Texts longer than this are split on sentence boundaries and synthesized in parallel
+TTS_CHUNK_CHARS = 200
+
+# Fixed input used by health_check; its clip is generated once and then served from cache
+HEALTHCHECK_TEXT = "Hello"
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_for_tts(text: str, max_chars: int = TTS_CHUNK_CHARS) -> List[str]:
+    """Split text into sentence chunks packed up to max_chars each"""
+    chunks: List[str] = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
 class TTSService:
     """Service for Text-to-Speech conversion using gTTS"""
     
@@ -36,8 +164,59 @@ class TTSService:
         
         # Cache settings
         self.max_cache_size = int(os.getenv("TTS_MAX_CACHE_SIZE_MB", "100")) * 1024 * 1024  # Convert to bytes
+        # Eviction starts above the high-water mark and frees space down to the low-water mark
+        self._cache_high_water = int(self.max_cache_size * 0.95)
+        self._cache_low_water = int(self.max_cache_size * 0.80)
         self.cache_ttl_hours = int(os.getenv("TTS_CACHE_TTL_HOURS", "24"))
         
+        # Running total of cached bytes, kept up to date on every write and unlink
+        self._cache_bytes = 0
+        self._last_full_scan = 0.0
+        self._scan_cache_size()
+        
+        # Cache cleanup runs in the background, at most once per interval
+        self._last_cleanup = 0.0
+        self._cleanup_interval_s = CACHE_CLEANUP_INTERVAL_SECONDS
+        self._background_tasks: set = set()
+        
+        # Conversions in progress, so concurrent identical requests share one gTTS call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Micro-batching: conversions arriving within a short window are dispatched
+        # to the thread pool together by a lazily started worker
+        self._batch_window = int(os.getenv("TTS_BATCH_WINDOW_MS", "10")) / 1000
+        self._max_batch = int(os.getenv("TTS_MAX_BATCH", "8"))
+        self._pending_batch: List[Tuple[Tuple[str, str, bool, str], asyncio.Future]] = []
+        self._batch_full = asyncio.Event()
+        self._batch_worker_task: Optional[asyncio.Task] = None
+        
+        # Upstream gTTS request rate; cache hits never consume a token
+        rate_per_min = int(os.getenv("TTS_RATE_PER_MIN", "300"))
+        self._limiter = _TokenBucket(rate_per_min, 60) if rate_per_min > 0 else None
+        
+        # In-process LRU of hot clips in front of the disk cache: key -> (stored_at, audio)
+        self._mem_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._mem_cache_max = int(os.getenv("TTS_MEM_CACHE_ENTRIES", "256"))
+        
+        # Bounds concurrent conversions within a batch
+        self._batch_sem = asyncio.Semaphore(int(os.getenv("TTS_BATCH_CONCURRENCY", "5")))
+        
+        # Bounds concurrent sentence chunks of a single long text
+        self._chunk_sem = asyncio.Semaphore(4)
+        
+        # Health probes only look up the pre-warmed clip instead of calling gTTS
+        self._healthcheck_key = self._generate_cache_key(
+            self.text_cleaner.clean_text(HEALTHCHECK_TEXT), "en", False, self.audio_format
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # No loop yet (module-level instance); the first probe warms the cache
+        else:
+            task = asyncio.create_task(self._warm_healthcheck())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        
         logger.info(f"TTS Service initialized with language: {self.default_language}")
     
     async def convert_text_to_speech(
@@ -64,7 +243,7 @@ class TTSService:
             format_type = audio_format or self.audio_format
             
             # Validate language
-            if lang not in self.supported_languages:
+            if lang not in SUPPORTED_LANGUAGE_CODES:
                 return {
                     "success": False,
                     "error": f"Unsupported language: {lang}",
@@ -87,7 +266,7 @@ class TTSService:
                 }
             
             # Convert text to speech
-            audio_data = await self._generate_speech(cleaned_text, lang, slow_speech, format_type)
+            audio_data = await self._generate_coalesced(cache_key, cleaned_text, lang, slow_speech, format_type)
             if not audio_data:
                 return {
                     "success": False,
@@ -95,11 +274,8 @@ class TTSService:
                     "audio_data": None
                 }
             
-            # Cache the audio
-            await self._cache_audio(cache_key, audio_data)
-            
-            # Clean up old cache files
-            await self._cleanup_cache()
+            # Clean up old cache files without holding up the response
+            self._schedule_cleanup()
             
             return {
                 "success": True,
@@ -190,18 +366,17 @@ class TTSService:
                     "results": []
                 }
             
-            results = []
-            for i, text in enumerate(texts):
-                result = await self.convert_text_to_speech(
-                    text, 
-                    language=language, 
-                    slow=slow
-                )
+            async def convert_one(i: int, text: str) -> Dict[str, Any]:
+                async with self._batch_sem:
+                    result = await self.convert_text_to_speech(
+                        text, 
+                        language=language, 
+                        slow=slow
+                    )
                 result["index"] = i
-                results.append(result)
-                
-                # Small delay between conversions to avoid overwhelming the service
-                await asyncio.sleep(0.1)
+                return result
+            
+            results = await asyncio.gather(*(convert_one(i, text) for i, text in enumerate(texts)))
             
             success_count = sum(1 for r in results if r["success"])
             
@@ -272,17 +447,17 @@ class TTSService:
     async def health_check(self) -> Dict[str, Any]:
         """Check TTS service health"""
         try:
-            # Test TTS conversion with a simple text
-            test_result = await self.convert_text_to_speech("Hello", language="en", slow=False)
+            # Only fall back to a real conversion when the health-check clip is not cached
+            test_ok = self._is_healthcheck_cached() or await self._warm_healthcheck()
             
             return {
-                "status": "healthy" if test_result["success"] else "unhealthy",
+                "status": "healthy" if test_ok else "unhealthy",
                 "service": "TTS",
                 "default_language": self.default_language,
                 "supported_languages_count": len(self.supported_languages),
                 "cache_directory": str(self.cache_dir),
                 "cache_size_mb": round(self._get_cache_size() / (1024 * 1024), 2),
-                "test_conversion": test_result["success"],
+                "test_conversion": test_ok,
                 "timestamp": self.time_utils.get_current_timestamp()
             }
             
@@ -295,25 +470,20 @@ class TTSService:
                 "timestamp": self.time_utils.get_current_timestamp()
             }
     
+    async def _warm_healthcheck(self) -> bool:
+        """Generate and cache the fixed health-check clip"""
+        result = await self.convert_text_to_speech(HEALTHCHECK_TEXT, language="en", slow=False)
+        return result["success"]
+    
+    def _is_healthcheck_cached(self) -> bool:
+        """Check the memory and disk caches for the health-check clip"""
+        if self._healthcheck_key in self._mem_cache:
+            return True
+        return (self.cache_dir / f"{self._healthcheck_key}.{self.audio_format}").exists()
+    
     def _get_supported_languages(self) -> Dict[str, str]:
         """Get supported languages for TTS"""
-        try:
-            return tts_langs()
-        except Exception as e:
-            logger.warning(f"Could not get TTS languages: {e}")
-            # Fallback to common languages
-            return {
-                "en": "English",
-                "es": "Spanish",
-                "fr": "French",
-                "de": "German",
-                "it": "Italian",
-                "pt": "Portuguese",
-                "ru": "Russian",
-                "ja": "Japanese",
-                "ko": "Korean",
-                "zh": "Chinese"
-            }
+        return _load_tts_langs()
     
     def _generate_cache_key(
         self, 
@@ -323,14 +493,25 @@ class TTSService:
         format_type: str
     ) -> str:
         """Generate cache key for audio data"""
-        import hashlib
-        
-        # Create a unique key based on text content and parameters
-        key_string = f"{text}_{language}_{slow}_{format_type}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # Hash the text and parameters incrementally rather than building a joined copy
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(text.encode())
+        digest.update(b"|")
+        digest.update(language.encode())
+        digest.update(b"|1|" if slow else b"|0|")
+        digest.update(format_type.encode())
+        return digest.hexdigest()
     
     async def _get_cached_audio(self, cache_key: str) -> Optional[bytes]:
         """Get cached audio data if available and not expired"""
+        entry = self._mem_cache.get(cache_key)
+        if entry is not None:
+            stored_at, audio_data = entry
+            if time.time() - stored_at < self.cache_ttl_hours * 3600:
+                self._mem_cache.move_to_end(cache_key)
+                return audio_data
+            del self._mem_cache[cache_key]
+        
         try:
             cache_file = self.cache_dir / f"{cache_key}.{self.audio_format}"
             
@@ -339,39 +520,95 @@ class TTSService:
             
             # Check if cache is expired
             if self._is_cache_expired(cache_file):
-                cache_file.unlink()  # Remove expired cache
+                self._remove_cache_file(cache_file)  # Remove expired cache
                 return None
             
-            # Read cached audio
-            with open(cache_file, "rb") as f:
-                return f.read()
+            # Read cached audio without blocking the event loop
+            if AIOFILES_AVAILABLE:
+                async with aiofiles.open(cache_file, "rb") as f:
+                    audio_data = await f.read()
+            else:
+                audio_data = await asyncio.to_thread(cache_file.read_bytes)
+            self._remember_audio(cache_key, audio_data, cache_file.stat().st_mtime)
+            return audio_data
                 
         except Exception as e:
             logger.warning(f"Error reading cache: {e}")
             return None
     
+    async def _iter_cached_audio(self, cache_key: str, chunk_size: int = 32 * 1024) -> AsyncIterator[bytes]:
+        """Yield a cached clip in chunks, for streaming responses"""
+        entry = self._mem_cache.get(cache_key)
+        if entry is not None and time.time() - entry[0] < self.cache_ttl_hours * 3600:
+            audio_data = entry[1]
+            for start in range(0, len(audio_data), chunk_size):
+                yield audio_data[start:start + chunk_size]
+            return
+        
+        cache_file = self.cache_dir / f"{cache_key}.{self.audio_format}"
+        if not cache_file.exists() or self._is_cache_expired(cache_file):
+            return
+        
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(cache_file, "rb") as f:
+                while True:
+                    chunk = await f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        else:
+            with open(cache_file, "rb") as f:
+                while True:
+                    chunk = await asyncio.to_thread(f.read, chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+    
     async def _cache_audio(self, cache_key: str, audio_data: bytes):
         """Cache audio data to file"""
+        self._remember_audio(cache_key, audio_data, time.time())
         try:
             cache_file = self.cache_dir / f"{cache_key}.{self.audio_format}"
             
             with open(cache_file, "wb") as f:
                 f.write(audio_data)
+            self._cache_bytes += len(audio_data)
             
             logger.debug(f"Cached audio: {cache_key}")
             
         except Exception as e:
             logger.warning(f"Error caching audio: {e}")
     
+    def _remember_audio(self, cache_key: str, audio_data: bytes, stored_at: float):
+        """Add audio to the in-memory LRU, evicting the least recently used entries"""
+        if self._mem_cache_max <= 0:
+            return
+        self._mem_cache[cache_key] = (stored_at, audio_data)
+        self._mem_cache.move_to_end(cache_key)
+        while len(self._mem_cache) > self._mem_cache_max:
+            self._mem_cache.popitem(last=False)
+    
+    def _schedule_cleanup(self):
+        """Start a background cache cleanup unless one ran within the interval"""
+        now = time.monotonic()
+        if now - self._last_cleanup <= self._cleanup_interval_s:
+            return
+        self._last_cleanup = now
+        # Keep a reference so the task is not garbage-collected mid-run
+        task = asyncio.create_task(self._cleanup_cache())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
     async def _cleanup_cache(self):
         """Clean up old cache files"""
         try:
-            current_time = self.time_utils.get_current_timestamp()
+            expires_before = time.time() - self.cache_ttl_hours * 3600
             
-            for cache_file in self.cache_dir.glob(f"*.{self.audio_format}"):
-                if self._is_cache_expired(cache_file):
-                    cache_file.unlink()
-                    logger.debug(f"Removed expired cache: {cache_file}")
+            for entry in self._iter_cache_entries():
+                entry_stat = entry.stat()
+                if entry_stat.st_mtime < expires_before:
+                    self._remove_cache_file(entry.path, entry_stat.st_size)
+                    logger.debug(f"Removed expired cache: {entry.path}")
             
             # Check cache size and remove oldest files if needed
             await self._enforce_cache_size_limit()
@@ -382,10 +619,9 @@ class TTSService:
     def _is_cache_expired(self, cache_file: Path) -> bool:
         """Check if cache file is expired"""
         try:
-            current_time = datetime.now().timestamp()
-            file_age = current_time - cache_file.stat().st_mtime
+            file_age = time.time() - cache_file.stat().st_mtime
             return file_age > (self.cache_ttl_hours * 3600)  # Convert hours to seconds
-        except Exception:
+        except OSError:
             return True  # Consider expired if we can't check
     
     async def _enforce_cache_size_limit(self):
@@ -393,37 +629,86 @@ class TTSService:
         try:
             current_size = self._get_cache_size()
             
-            if current_size <= self.max_cache_size:
+            if current_size <= self._cache_high_water:
                 return
             
             # Get all cache files sorted by modification time (oldest first)
             cache_files = sorted(
-                self.cache_dir.glob(f"*.{self.audio_format}"),
-                key=lambda x: x.stat().st_mtime
+                ((entry.path, entry.stat()) for entry in self._iter_cache_entries()),
+                key=lambda item: item[1].st_mtime
             )
             
-            # Remove oldest files until we're under the limit
-            for cache_file in cache_files:
-                if current_size <= self.max_cache_size:
+            # Remove oldest files until we're back under the low-water mark
+            for cache_path, cache_stat in cache_files:
+                if current_size <= self._cache_low_water:
                     break
                 
-                file_size = cache_file.stat().st_size
-                cache_file.unlink()
-                current_size -= file_size
-                logger.debug(f"Removed old cache file: {cache_file}")
+                current_size -= self._remove_cache_file(cache_path, cache_stat.st_size)
+                logger.debug(f"Removed old cache file: {cache_path}")
                 
         except Exception as e:
             logger.warning(f"Error enforcing cache size limit: {e}")
     
     def _get_cache_size(self) -> int:
         """Get total size of cache directory in bytes"""
+        if time.time() - self._last_full_scan > CACHE_RESCAN_INTERVAL_SECONDS:
+            self._scan_cache_size()
+        return self._cache_bytes
+    
+    def _scan_cache_size(self):
+        """Recount the cache directory to correct drift in the running total"""
         try:
-            total_size = 0
-            for cache_file in self.cache_dir.glob(f"*.{self.audio_format}"):
-                total_size += cache_file.stat().st_size
-            return total_size
+            self._cache_bytes = sum(entry.stat().st_size for entry in self._iter_cache_entries())
         except Exception:
-            return 0
+            self._cache_bytes = 0
+        self._last_full_scan = time.time()
+    
+    def _iter_cache_entries(self) -> Iterator[os.DirEntry]:
+        """Cache files as DirEntry objects, whose stat() reuses the directory scan where possible"""
+        suffix = f".{self.audio_format}"
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    yield entry
+    
+    def _remove_cache_file(self, cache_file: Union[str, Path], file_size: Optional[int] = None) -> int:
+        """Delete a cache file and return the bytes freed"""
+        if file_size is None:
+            file_size = os.stat(cache_file).st_size
+        os.unlink(cache_file)
+        self._cache_bytes = max(0, self._cache_bytes - file_size)
+        return file_size
+    
+    async def _generate_coalesced(
+        self, 
+        cache_key: str, 
+        text: str, 
+        language: str, 
+        slow: bool, 
+        format_type: str
+    ) -> Optional[bytes]:
+        """Generate and cache speech, or wait on an identical conversion already running"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # The service owns the conversion, so a cancelled caller never cancels it for the others
+            task = asyncio.create_task(self._generate_and_cache(cache_key, text, language, slow, format_type))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _generate_and_cache(
+        self, 
+        cache_key: str, 
+        text: str, 
+        language: str, 
+        slow: bool, 
+        format_type: str
+    ) -> Optional[bytes]:
+        """Generate speech and write it to the cache"""
+        audio_data = await self._generate_speech(text, language, slow, format_type)
+        if audio_data:
+            await self._cache_audio(cache_key, audio_data)
+        return audio_data
     
     async def _generate_speech(
         self, 
@@ -433,28 +718,88 @@ class TTSService:
         format_type: str
     ) -> Optional[bytes]:
         """Generate speech audio using gTTS"""
+        if len(text) > TTS_CHUNK_CHARS:
+            chunks = _split_for_tts(text)
+            if len(chunks) > 1:
+                return await self._generate_chunked(chunks, language, slow, format_type)
+        
         try:
-            # Create temporary file for audio
-            with tempfile.NamedTemporaryFile(suffix=f".{format_type}", delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            # Generate speech
-            tts = gTTS(text=text, lang=language, slow=slow)
-            tts.save(temp_path)
-            
-            # Read audio data
-            with open(temp_path, "rb") as f:
-                audio_data = f.read()
-            
-            # Clean up temporary file
-            os.unlink(temp_path)
-            
-            return audio_data
+            future = asyncio.get_running_loop().create_future()
+            self._pending_batch.append(((text, language, slow, format_type), future))
+            if len(self._pending_batch) >= self._max_batch:
+                self._batch_full.set()
+            if self._batch_worker_task is None or self._batch_worker_task.done():
+                self._batch_worker_task = asyncio.create_task(self._batch_worker())
+            return await future
             
         except Exception as e:
             logger.error(f"Error generating speech: {e}")
             return None
     
+    async def _generate_chunked(
+        self,
+        chunks: List[str],
+        language: str,
+        slow: bool,
+        format_type: str
+    ) -> Optional[bytes]:
+        """Synthesize sentence chunks concurrently and join the MP3 frames in order"""
+        async def _one_chunk(chunk: str) -> Optional[bytes]:
+            async with self._chunk_sem:
+                return await self._generate_speech(chunk, language, slow, format_type)
+        
+        # gather returns results in argument order, so the audio stays in sequence
+        parts = await asyncio.gather(*(_one_chunk(chunk) for chunk in chunks))
+        if any(part is None for part in parts):
+            return None
+        return b"".join(parts)
+    
+    async def _batch_worker(self):
+        """Drain pending conversions in batches of up to _max_batch per window"""
+        while self._pending_batch:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self._batch_window)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_full.clear()
+            batch = self._pending_batch[:self._max_batch]
+            del self._pending_batch[:self._max_batch]
+            if len(self._pending_batch) >= self._max_batch:
+                self._batch_full.set()
+            # Each batch runs on its own so the next window is not held up
+            task = asyncio.create_task(self._run_batch(batch))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[Tuple[str, str, bool, str], asyncio.Future]]):
+        """Run one batch of conversions concurrently on the TTS thread pool"""
+        loop = asyncio.get_running_loop()
+        
+        async def convert_one(args: Tuple[str, str, bool, str]) -> bytes:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            return await loop.run_in_executor(TTS_EXECUTOR, self._sync_generate, *args)
+        
+        results = await asyncio.gather(
+            *(convert_one(args) for args, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():  # the waiting request was cancelled
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    @staticmethod
+    def _sync_generate(text: str, language: str, slow: bool, format_type: str) -> bytes:
+        """Blocking gTTS call; runs on TTS_EXECUTOR"""
+        # Stream the MP3 bytes straight into memory instead of via a temp file
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+    
     def _estimate_audio_duration(self, audio_size_bytes: int) -> float:
         """Estimate audio duration based on file size"""
         # Rough estimation: 1MB ≈ 1 minute of audio for MP3
@@ -8,13 +8,48 @@ import os
 import json
 import logging
 import getpass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from cryptography.fernet import Fernet
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import base64
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4)
+def _cipher_for(key_path: str) -> "Fernet":
+    """Get or create the encryption key at key_path and return a shared cipher for it"""
+    # Imported lazily so code paths that never encrypt don't pay for loading cryptography
+    from cryptography.fernet import Fernet
+    
+    key_file = Path(key_path)
+    if key_file.exists():
+        with open(key_file, 'rb') as f:
+            key = f.read()
+    else:
+        key = Fernet.generate_key()
+        with open(key_file, 'wb') as f:
+            f.write(key)
+        # Make key file read-only
+        os.chmod(key_file, 0o600)
+    return Fernet(key)
+
+
+def _decrypt(cipher: "Fernet", encrypted_value: str) -> str:
+    """Decrypt one base64-wrapped value, returning an empty string on failure"""
+    if not encrypted_value:
+        return ""
+    try:
+        # b64decode accepts the ASCII str directly, no intermediate encode needed
+        return cipher.decrypt(base64.b64decode(encrypted_value)).decode()
+    except Exception as e:
+        logger.error(f"Decryption failed: {e}")
+        return ""
+
+
 class SecureConfig:
     """Secure configuration management with encryption support"""
     
@@ -25,42 +60,23 @@ class SecureConfig:
         self.env_file = Path(".env")
         self.encrypted_config = self.config_dir / "encrypted_config.json"
         self.key_file = self.config_dir / ".key"
-        
-        # Initialize encryption key
-        self.encryption_key = self._get_or_create_key()
-        self.cipher = Fernet(self.encryption_key)
     
-    def _get_or_create_key(self) -> bytes:
-        """Get or create encryption key"""
-        if self.key_file.exists():
-            with open(self.key_file, 'rb') as f:
-                return f.read()
-        else:
-            key = Fernet.generate_key()
-            with open(self.key_file, 'wb') as f:
-                f.write(key)
-            # Make key file read-only
-            os.chmod(self.key_file, 0o600)
-            return key
+    @property
+    def cipher(self) -> "Fernet":
+        """Cipher for this config's key file, loaded on first use"""
+        return _cipher_for(str(self.key_file))
     
     def encrypt_value(self, value: str) -> str:
         """Encrypt a configuration value"""
         if not value:
             return ""
-        encrypted = self.cipher.encrypt(value.encode())
-        return base64.b64encode(encrypted).decode()
+        return base64.b64encode(self.cipher.encrypt(value.encode())).decode("ascii")
     
     def decrypt_value(self, encrypted_value: str) -> str:
         """Decrypt a configuration value"""
         if not encrypted_value:
             return ""
-        try:
-            encrypted_bytes = base64.b64decode(encrypted_value.encode())
-            decrypted = self.cipher.decrypt(encrypted_bytes)
-            return decrypted.decode()
-        except Exception as e:
-            logger.error(f"Decryption failed: {e}")
-            return ""
+        return _decrypt(self.cipher, encrypted_value)
     
     def interactive_setup(self) -> bool:
         """Interactive API key setup with secure input"""
@@ -193,11 +209,12 @@ class SecureConfig:
             if not config_data.get("encrypted"):
                 return config_data.get("api_keys", {})
             
-            decrypted_keys = {}
-            for key, encrypted_value in config_data.get("api_keys", {}).items():
-                decrypted_keys[key] = self.decrypt_value(encrypted_value)
-            
-            return decrypted_keys
+            # Resolve the cipher once for the whole batch of keys
+            cipher = self.cipher
+            return {
+                key: _decrypt(cipher, encrypted_value)
+                for key, encrypted_value in config_data.get("api_keys", {}).items()
+            }
             
         except Exception as e:
             logger.error(f"Failed to load encrypted config: {e}")
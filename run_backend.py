@@ -47,6 +47,10 @@ def main():
             host=settings.host,
             port=settings.port,
             reload=settings.debug,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+            access_log=False,  # LogRequestsMiddleware already logs every request
             log_level=settings.log_level.lower()
         )
         
@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from backend.services.ai.batch_dispatcher import BatchDispatcher
+
+
+class StubBatchClient:
+    """Minimal stand-in for the OpenAI files and batches APIs"""
+    
+    def __init__(self, fail_ids=(), drop_ids=(), status="completed"):
+        self.fail_ids = set(fail_ids)
+        self.drop_ids = set(drop_ids)
+        self.status = status
+        self.uploads = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+    
+    async def _create_file(self, file, purpose):
+        self.uploads.append([orjson.loads(line) for line in file[1].splitlines()])
+        return SimpleNamespace(id=f"file-{len(self.uploads)}")
+    
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+    
+    async def _retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status=self.status, output_file_id="file-out")
+    
+    async def _file_content(self, file_id):
+        lines = []
+        # Output order is not guaranteed, so answer in reverse
+        for request in reversed(self.uploads[-1]):
+            content = request["body"]["messages"][0]["content"]
+            if content in self.drop_ids:
+                continue
+            if content in self.fail_ids:
+                response = {"status_code": 500, "body": {}}
+            else:
+                response = {"status_code": 200, "body": {"echo": content}}
+            lines.append(orjson.dumps({"custom_id": request["custom_id"], "response": response}).decode())
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def _body(content):
+    return {"model": "gpt-4", "messages": [{"role": "user", "content": content}]}
+
+
+class TestBatchDispatcher:
+    """Test class for BatchDispatcher"""
+    
+    @pytest.mark.asyncio
+    async def test_resolves_futures_by_custom_id(self):
+        """Each caller gets the result for its own request regardless of output order"""
+        client = StubBatchClient()
+        dispatcher = BatchDispatcher(client, batch_window_ms=10, poll_interval=0)
+        results = await asyncio.gather(*(dispatcher.submit(_body(f"msg-{i}")) for i in range(5)))
+        assert [result["echo"] for result in results] == [f"msg-{i}" for i in range(5)]
+        assert len(client.uploads) == 1
+        await dispatcher.close()
+    
+    @pytest.mark.asyncio
+    async def test_splits_at_batch_max_size(self):
+        """Requests beyond batch_max_size go into a separate batch"""
+        client = StubBatchClient()
+        dispatcher = BatchDispatcher(client, batch_window_ms=10, batch_max_size=2, poll_interval=0)
+        results = await asyncio.gather(*(dispatcher.submit(_body(f"msg-{i}")) for i in range(3)))
+        assert [result["echo"] for result in results] == ["msg-0", "msg-1", "msg-2"]
+        assert [len(upload) for upload in client.uploads] == [2, 1]
+        await dispatcher.close()
+    
+    @pytest.mark.asyncio
+    async def test_failed_request_raises_for_its_caller_only(self):
+        """A failed line rejects only its own future"""
+        client = StubBatchClient(fail_ids={"bad"})
+        dispatcher = BatchDispatcher(client, batch_window_ms=10, poll_interval=0)
+        results = await asyncio.gather(
+            dispatcher.submit(_body("good")),
+            dispatcher.submit(_body("bad")),
+            return_exceptions=True
+        )
+        assert results[0] == {"echo": "good"}
+        assert isinstance(results[1], RuntimeError)
+        await dispatcher.close()
+    
+    @pytest.mark.asyncio
+    async def test_missing_output_fails_remaining_requests(self):
+        """Requests absent from the output file are rejected"""
+        client = StubBatchClient(drop_ids={"lost"})
+        dispatcher = BatchDispatcher(client, batch_window_ms=10, poll_interval=0)
+        results = await asyncio.gather(
+            dispatcher.submit(_body("kept")),
+            dispatcher.submit(_body("lost")),
+            return_exceptions=True
+        )
+        assert results[0] == {"echo": "kept"}
+        assert isinstance(results[1], RuntimeError)
+        await dispatcher.close()
+    
+    @pytest.mark.asyncio
+    async def test_unsuccessful_batch_rejects_all(self):
+        """A batch that does not complete rejects every queued request"""
+        client = StubBatchClient(status="failed")
+        dispatcher = BatchDispatcher(client, batch_window_ms=10, poll_interval=0)
+        results = await asyncio.gather(
+            dispatcher.submit(_body("a")),
+            dispatcher.submit(_body("b")),
+            return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        await dispatcher.close()
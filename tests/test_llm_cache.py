@@ -0,0 +1,85 @@
+from backend.services.ai.llm_cache import LFUCache, make_cache_key
+
+
+class TestLFUCache:
+    """Test class for LFUCache"""
+    
+    def test_get_and_put(self):
+        """Stored values are returned and misses return the default"""
+        cache = LFUCache(2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+    
+    def test_evicts_least_frequently_used(self):
+        """The key with the fewest uses is evicted first"""
+        cache = LFUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_ties_evict_least_recently_used(self):
+        """Among keys with equal use counts, the oldest is evicted"""
+        cache = LFUCache(3)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", 4)
+        assert cache.get("c") is None
+        cache.get("d")
+        cache.get("d")
+        cache.put("e", 5)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("d") == 4
+    
+    def test_put_existing_key_updates_and_counts_as_use(self):
+        """Overwriting a key keeps it and bumps its use count"""
+        cache = LFUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 10)
+        cache.put("c", 3)
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+    
+    def test_zero_capacity_stores_nothing(self):
+        """A zero-capacity cache never stores values"""
+        cache = LFUCache(0)
+        cache.put("a", 1)
+        assert len(cache) == 0
+        assert cache.get("a") is None
+    
+    def test_stats(self):
+        """Hits, misses and hit rate are tracked"""
+        cache = LFUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["size"] == 1
+
+
+class TestMakeCacheKey:
+    """Test class for make_cache_key"""
+    
+    def test_normalizes_whitespace_and_case(self):
+        """Messages differing only in whitespace or case share a key"""
+        a = make_cache_key("gpt-4", 0.7, [{"role": "user", "content": "Hello  World"}])
+        b = make_cache_key("gpt-4", 0.7, [{"role": "user", "content": " hello world "}])
+        assert a == b
+    
+    def test_model_and_temperature_change_key(self):
+        """Different models or temperatures produce different keys"""
+        messages = [{"role": "user", "content": "Hello"}]
+        assert make_cache_key("gpt-4", 0.7, messages) != make_cache_key("gpt-3.5-turbo", 0.7, messages)
+        assert make_cache_key("gpt-4", 0.7, messages) != make_cache_key("gpt-4", 0.5, messages)
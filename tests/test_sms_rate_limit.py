@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from backend.services.smsService import SMSService, RATE_LIMIT_DAY_SECONDS, RATE_LIMIT_HOUR_SECONDS
+
+
+class TestSMSRateLimits:
+    """Test the in-process sliding-window SMS rate limits"""
+    
+    @pytest.fixture
+    def sms_service(self, monkeypatch):
+        """Create an SMSService that uses the in-process window"""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        service = SMSService()
+        service._rate_limit_script = None
+        service._local_sends.clear()
+        service.max_sms_per_hour = 3
+        service.max_sms_per_day = 5
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_hour_limit(self, sms_service):
+        """Sends beyond the hourly limit are rejected"""
+        now = 1_000_000.0
+        assert await sms_service._check_rate_limits(2, now) is True
+        assert await sms_service._check_rate_limits(1, now + 1) is True
+        assert await sms_service._check_rate_limits(1, now + 2) is False
+    
+    @pytest.mark.asyncio
+    async def test_hour_window_slides(self, sms_service):
+        """Sends older than an hour no longer count toward the hourly limit"""
+        now = 1_000_000.0
+        assert await sms_service._check_rate_limits(3, now) is True
+        assert await sms_service._check_rate_limits(1, now + RATE_LIMIT_HOUR_SECONDS - 1) is False
+        assert await sms_service._check_rate_limits(1, now + RATE_LIMIT_HOUR_SECONDS) is True
+    
+    @pytest.mark.asyncio
+    async def test_day_limit(self, sms_service):
+        """Sends beyond the daily limit are rejected even across hours"""
+        now = 1_000_000.0
+        assert await sms_service._check_rate_limits(3, now) is True
+        assert await sms_service._check_rate_limits(2, now + RATE_LIMIT_HOUR_SECONDS) is True
+        assert await sms_service._check_rate_limits(1, now + 2 * RATE_LIMIT_HOUR_SECONDS) is False
+        assert await sms_service._check_rate_limits(1, now + RATE_LIMIT_DAY_SECONDS - 1) is False
+        # The first three sends have left the day window; two remain
+        assert await sms_service._check_rate_limits(3, now + RATE_LIMIT_DAY_SECONDS) is True
+        assert await sms_service._check_rate_limits(1, now + RATE_LIMIT_DAY_SECONDS) is False
+    
+    @pytest.mark.asyncio
+    async def test_rejected_request_reserves_nothing(self, sms_service):
+        """A rejected batch does not consume any slots"""
+        now = 1_000_000.0
+        assert await sms_service._check_rate_limits(4, now) is False
+        assert len(sms_service._local_sends) == 0
+        assert await sms_service._check_rate_limits(3, now) is True
+        assert len(sms_service._local_sends) == 3
+    
+    @pytest.mark.asyncio
+    async def test_safety_and_status_sends_are_counted_not_refused(self, sms_service):
+        """Safety notifications and status updates go out at the limit but still count"""
+        async def fake_send(recipients, message, message_type, timestamp):
+            return [{"success": True, "recipient": recipient} for recipient in recipients]
+        sms_service._send_to_recipients = fake_send
+        
+        assert await sms_service._check_rate_limits(3, time.time()) is True
+        safety = await sms_service.send_safety_notification({"description": "Test"}, ["+15551234567"])
+        status = await sms_service.send_status_update({"status": "Resolved"}, ["+15551234567"])
+        assert safety["sent_count"] == 1
+        assert status["sent_count"] == 1
+        assert len(sms_service._local_sends) == 5
+        assert await sms_service._check_rate_limits(1, time.time()) is False